@@ -1,16 +1,46 @@
 """Database configuration and session management."""
 from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 from core.config import get_settings
 
 settings = get_settings()
 
+
+def _engine_options(database_url: str) -> dict:
+    """Pool and driver options - only PostgreSQL (asyncpg) gets a sized pool."""
+    if make_url(database_url).get_backend_name() != "postgresql":
+        return {}
+    # JIT compilation costs more than it saves on short OLTP queries
+    connect_args = {"server_settings": {"jit": "off"}}
+    if settings.DB_USE_PGBOUNCER:
+        # Transaction-mode pgbouncer hands each transaction to any backend, so
+        # server-side prepared statements can't be reused - disable both caches
+        # and let the bouncer do the pooling
+        connect_args["statement_cache_size"] = 0
+        connect_args["prepared_statement_cache_size"] = 0
+        return {"poolclass": NullPool, "connect_args": connect_args}
+
+    # Direct connections keep prepared statements, so repeated query shapes
+    # skip PostgreSQL's parse/plan
+    connect_args["prepared_statement_cache_size"] = settings.DB_STATEMENT_CACHE_SIZE
+    return {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_pre_ping": True,
+        "connect_args": connect_args,
+    }
+
+
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
     future=True,
+    **_engine_options(settings.DATABASE_URL),
 )
 
 # Create session factory
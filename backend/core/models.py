@@ -2,7 +2,7 @@
 import uuid
 import json
 from sqlalchemy import String, Text, TypeDecorator
-from sqlalchemy.dialects.postgresql import UUID as PG_UUID, JSON as PG_JSON
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, JSON as PG_JSON, JSONB as PG_JSONB
 
 
 class UUID(TypeDecorator):
@@ -75,3 +75,31 @@ class JSONList(TypeDecorator):
                 return json.loads(value) if value else []
             except (json.JSONDecodeError, TypeError):
                 return []
+
+
+class JSONText(TypeDecorator):
+    """Platform-independent JSON document held as a serialized string.
+
+    Uses PostgreSQL's JSONB type when available (parsed once on write, GIN-indexable),
+    otherwise uses TEXT for SQLite. The Python value is always the JSON string.
+    """
+    impl = Text
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == 'postgresql':
+            return dialect.type_descriptor(PG_JSONB())
+        else:
+            return dialect.type_descriptor(Text())
+
+    def process_bind_param(self, value, dialect):
+        if value is None or dialect.name != 'postgresql':
+            return value
+        # JSONB serializes on bind - hand it the document, not the string
+        return json.loads(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None or isinstance(value, str):
+            return value
+        # PostgreSQL: JSONB comes back decoded
+        return json.dumps(value)
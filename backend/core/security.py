@@ -1,8 +1,10 @@
 """Security utilities: JWT, password hashing, phone validation, rate limiting."""
 import re
+import time
 import hashlib
 import hmac
 from datetime import datetime, timedelta, timezone
+from functools import partial
 from typing import Any
 from collections import defaultdict
 import jwt
@@ -22,6 +24,10 @@ settings = get_settings()
 # Phone Number Handling
 # ============================================================================
 
+# Everything except digits and '+' - compiled once, used on every login/registration
+_PHONE_STRIP_RE = re.compile(r'[^\d+]')
+
+
 def normalize_phone_number(phone: str) -> str:
     """
     Normalize phone number - just clean up formatting.
@@ -29,7 +35,7 @@ def normalize_phone_number(phone: str) -> str:
     Accepts any phone number format, removes spaces and special characters.
     """
     # Remove all non-digit characters except +
-    cleaned = re.sub(r'[^\d+]', '', phone)
+    cleaned = _PHONE_STRIP_RE.sub('', phone)
 
     # Just return as-is, no validation
     return cleaned if cleaned else phone
@@ -44,9 +50,13 @@ def validate_phone_number(phone: str) -> bool:
 # Password Handling
 # ============================================================================
 
+# Cost factor is fixed for the process - bind it once; every call still gets a fresh salt
+_gensalt = partial(bcrypt.gensalt, rounds=settings.BCRYPT_ROUNDS)
+
+
 def hash_password(password: str) -> str:
     """Hash password using bcrypt."""
-    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    salt = _gensalt()
     hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
     return hashed.decode('utf-8')
 
@@ -139,13 +149,31 @@ def create_refresh_token(user_id: str) -> tuple[str, str]:
     return token, token_id
 
 
+# Verified access-token payloads keyed by the raw token: (cached_at, payload).
+# Clients send the same token on every request, so a hit skips the signature
+# check and JSON decode. The token's own exp is still enforced on every hit,
+# and the user is re-loaded from the DB per request regardless.
+_ACCESS_TOKEN_CACHE_TTL_SECONDS = 30
+_ACCESS_TOKEN_CACHE_SIZE = 1024
+_access_token_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+
+
 def verify_access_token(token: str) -> dict[str, Any]:
     """
     Verify and decode access token.
 
-    Returns decoded payload.
+    Returns decoded payload (a copy - safe to modify).
     Raises InvalidTokenException or TokenExpiredException.
     """
+    now = time.monotonic()
+    cached = _access_token_cache.get(token)
+    if cached is not None and now - cached[0] < _ACCESS_TOKEN_CACHE_TTL_SECONDS:
+        payload = cached[1]
+        if payload["exp"] <= time.time():
+            _access_token_cache.pop(token, None)
+            raise TokenExpiredException()
+        return dict(payload)
+
     try:
         payload = jwt.decode(
             token,
@@ -160,7 +188,14 @@ def verify_access_token(token: str) -> dict[str, Any]:
     if payload.get("type") != "access":
         raise InvalidTokenException("Not an access token")
 
-    return payload
+    if token in _access_token_cache:
+        # Refreshing an expired entry - re-insert so it moves to the newest end
+        del _access_token_cache[token]
+    elif len(_access_token_cache) >= _ACCESS_TOKEN_CACHE_SIZE:
+        # Drop the oldest entry (dicts keep insertion order)
+        _access_token_cache.pop(next(iter(_access_token_cache)), None)
+    _access_token_cache[token] = (now, payload)
+    return dict(payload)
 
 
 def verify_refresh_token(token: str) -> dict[str, Any]:
@@ -2,10 +2,10 @@
 import uuid
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
-from sqlalchemy import String, DateTime, ForeignKey, Enum, Text
+from sqlalchemy import DDL, Index, String, DateTime, ForeignKey, Enum, event
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from core.database import Base
-from core.models import UUID
+from core.models import JSONText, UUID
 from core.enums import AuditAction, EntityType
 
 if TYPE_CHECKING:
@@ -21,6 +21,12 @@ class AuditLog(Base):
     """
 
     __tablename__ = "audit_logs"
+    # PostgreSQL: range-partitioned by month (partitions created below), so old
+    # months are dropped as whole tables and timestamp-bounded scans skip the rest.
+    # The partition key must be part of the primary key, so it is (id, timestamp):
+    # the database no longer enforces id alone as unique - that rests on uuid4.
+    # create_all doesn't convert an existing table - see scripts/db/README.md
+    __table_args__ = {"postgresql_partition_by": "RANGE (timestamp)"}
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -31,8 +37,7 @@ class AuditLog(Base):
     # What was changed
     entity_type: Mapped[EntityType] = mapped_column(
         Enum(EntityType, native_enum=False, length=50),
-        nullable=False,
-        index=True
+        nullable=False
     )
     entity_id: Mapped[str] = mapped_column(
         String(255),
@@ -46,7 +51,7 @@ class AuditLog(Base):
     )
 
     # Change details (JSON: {field: {old: val, new: val}} for UPDATE, {field: val} for CREATE/DELETE)
-    changes: Mapped[str] = mapped_column(Text, nullable=False)
+    changes: Mapped[str] = mapped_column(JSONText, nullable=False)
 
     # Who made the change
     user_id: Mapped[uuid.UUID] = mapped_column(
@@ -64,13 +69,13 @@ class AuditLog(Base):
     company_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("companies.id", ondelete="SET NULL"),
-        nullable=True,
-        index=True
+        nullable=True
     )
 
-    # When
+    # When - part of the primary key because PostgreSQL requires the partition key in it
     timestamp: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        primary_key=True,
         default=lambda: datetime.now(timezone.utc),
         nullable=False,
         index=True
@@ -84,3 +89,53 @@ class AuditLog(Base):
 
     def __repr__(self):
         return f"<AuditLog {self.action.value} {self.entity_type.value} by {self.username}>"
+
+
+# Composite indexes matching the repository's filter + ORDER BY timestamp DESC,
+# so a page is one index range scan with no sort. They also cover lookups on
+# their leading columns, which is why company_id / entity_type have no index of their own
+Index("ix_audit_logs_company_ts", AuditLog.company_id, AuditLog.timestamp.desc())
+Index(
+    "ix_audit_logs_entity",
+    AuditLog.entity_type,
+    AuditLog.entity_id,
+    AuditLog.timestamp.desc(),
+    # PostgreSQL: carry the small columns in the leaf pages so entity-history
+    # counts and metadata reads can be index-only scans
+    postgresql_include=["action", "user_id", "username", "company_id"],
+)
+
+# PostgreSQL only: containment queries on the change document (changes @> ...)
+Index("ix_audit_logs_changes_gin", AuditLog.changes, postgresql_using="gin").ddl_if(
+    dialect="postgresql"
+)
+
+
+# Monthly partitions for the current month and the next 12, plus a DEFAULT
+# partition so inserts never fail once they run out. Runs on create_all only -
+# scripts/db/create_partitions.py re-runs it and MUST be scheduled (e.g. a
+# monthly cron): once DEFAULT holds rows for a month, creating that month's
+# partition fails until those rows are moved out. Idempotent; retention is
+# DROP TABLE audit_logs_YYYY_MM instead of a mass DELETE.
+CREATE_AUDIT_LOG_PARTITIONS = DDL("""
+DO $$
+DECLARE
+    start_month date := date_trunc('month', now())::date;
+BEGIN
+    FOR i IN 0..12 LOOP
+        EXECUTE 'CREATE TABLE IF NOT EXISTS '
+            || quote_ident('audit_logs_' || to_char(start_month, 'YYYY_MM'))
+            || ' PARTITION OF audit_logs FOR VALUES FROM ('
+            || quote_literal(start_month) || ') TO ('
+            || quote_literal((start_month + interval '1 month')::date) || ')';
+        start_month := start_month + interval '1 month';
+    END LOOP;
+    CREATE TABLE IF NOT EXISTS audit_logs_default PARTITION OF audit_logs DEFAULT;
+END $$
+""")
+
+event.listen(
+    AuditLog.__table__,
+    "after_create",
+    CREATE_AUDIT_LOG_PARTITIONS.execute_if(dialect="postgresql"),
+)
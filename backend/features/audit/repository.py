@@ -1,12 +1,68 @@
 """Repository layer for audit logs - data access operations."""
+import time
 import uuid
-from sqlalchemy import select, and_
+from sqlalchemy import Row, bindparam, event, select, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import Session, selectinload
 from features.audit.models import AuditLog
 from core.enums import EntityType
 
 
+# Listings are read-only and only serialized - select plain Core rows (attribute
+# access like ORM objects) and skip identity-map/instrumentation overhead
+audit_logs = AuditLog.__table__
+
+# get_page statements, built once - only the parameters change between calls,
+# so each call skips statement construction and hits the compiled-SQL cache
+_page_query = (
+    select(audit_logs, func.count().over().label("total"))
+    .order_by(AuditLog.timestamp.desc())
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+_company_page_query = _page_query.where(AuditLog.company_id == bindparam("company_id"))
+
+# Entity-history pages, per process: {(entity_type, entity_id, company_id, skip, limit):
+# (cached_at, (rows, total))}, oldest first. Bounded in total size, entries
+# expire after the TTL. Audit logs are append-only, so a page only goes stale
+# when a new log for that entity is committed - that drops the entity's pages
+# (see _drop_committed_entity_pages); the TTL bounds staleness from writes
+# committed by other processes.
+_ENTITY_PAGE_CACHE_TTL_SECONDS = 10
+_ENTITY_PAGE_CACHE_SIZE = 10_000
+_entity_page_cache: dict[tuple, tuple[float, tuple[list[Row], int]]] = {}
+
+# Session.info key: (entity_type, entity_id) pairs the session logged but has not committed
+_UNCOMMITTED_ENTITIES = "audit_uncommitted_entities"
+
+
+def _cache_entity_page(key: tuple, page: tuple[list[Row], int], now: float) -> None:
+    """Store a page, first dropping expired entries and, when full, the oldest."""
+    _entity_page_cache.pop(key, None)  # Re-inserted at the end - order stays by age
+    while _entity_page_cache:
+        oldest = next(iter(_entity_page_cache))
+        expired = now - _entity_page_cache[oldest][0] >= _ENTITY_PAGE_CACHE_TTL_SECONDS
+        if not expired and len(_entity_page_cache) < _ENTITY_PAGE_CACHE_SIZE:
+            break
+        del _entity_page_cache[oldest]
+    _entity_page_cache[key] = (now, page)
+
+
+@event.listens_for(Session, "after_commit")
+def _drop_committed_entity_pages(session: Session) -> None:
+    """Drop cached pages of entities whose new logs were just committed."""
+    entities = session.info.pop(_UNCOMMITTED_ENTITIES, None)
+    if entities:
+        for key in [key for key in _entity_page_cache if key[:2] in entities]:
+            del _entity_page_cache[key]
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_entities(session: Session) -> None:
+    """Rolled-back logs never became visible - nothing to drop."""
+    session.info.pop(_UNCOMMITTED_ENTITIES, None)
+
+
 class AuditLogRepository:
     """Audit log repository implementation."""
 
@@ -19,6 +75,10 @@ class AuditLogRepository:
         """Save audit log to database."""
         self.db.add(audit_log)
         await self.db.flush()
+        # Cached pages for the entity are dropped once this commits
+        self.db.info.setdefault(_UNCOMMITTED_ENTITIES, set()).add(
+            (audit_log.entity_type, audit_log.entity_id)
+        )
         # Eagerly load user relationship
         result = await self.db.execute(
             select(AuditLog)
@@ -27,41 +87,52 @@ class AuditLogRepository:
         )
         return result.scalar_one()
 
-    async def get_all(
+    async def get_page(
         self,
         company_id: str | None = None,
         skip: int = 0,
         limit: int = 100
-    ) -> list[AuditLog]:
+    ) -> tuple[list[Row], int]:
         """
-        Get all audit logs with optional company filtering.
+        Get one page of audit logs plus the filtered total in a single query.
+
+        The total rides on every row as count(*) OVER (), so no separate
+        COUNT round-trip is needed.
 
         Args:
             company_id: Filter by company (None = system admin, sees all)
             skip: Number of records to skip
             limit: Maximum records to return
         """
-        query = select(AuditLog).options(selectinload(AuditLog.user))
-
-        # Apply company filter for non-system admins
-        if company_id is not None:
-            query = query.where(AuditLog.company_id == uuid.UUID(company_id))
-
-        query = query.order_by(AuditLog.timestamp.desc()).offset(skip).limit(limit)
-
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
-
-    async def get_by_entity(
+        if company_id is None:
+            result = await self.db.execute(_page_query, {"skip": skip, "limit": limit})
+        else:
+            result = await self.db.execute(
+                _company_page_query,
+                {"company_id": uuid.UUID(company_id), "skip": skip, "limit": limit}
+            )
+
+        rows = list(result.all())
+        if rows or not skip:
+            return rows, rows[0].total if rows else 0
+        # Past the last page - no row carries the total, count it separately
+        return rows, await self.count_all(company_id)
+
+    async def get_entity_page(
         self,
         entity_type: EntityType,
         entity_id: str,
         company_id: str | None = None,
         skip: int = 0,
         limit: int = 100
-    ) -> list[AuditLog]:
+    ) -> tuple[list[Row], int]:
         """
-        Get audit logs for a specific entity.
+        Get one page of a specific entity's audit logs plus the filtered total.
+
+        Single query, see get_page. Pages are cached for a few seconds (see
+        _entity_page_cache) so repeated history views skip the database. A
+        session that has logged the entity but not committed yet reads
+        through the cache and caches nothing.
 
         Args:
             entity_type: Type of entity (User, Company, Product)
@@ -70,26 +141,51 @@ class AuditLogRepository:
             skip: Number of records to skip
             limit: Maximum records to return
         """
+        if (entity_type, entity_id) in self.db.info.get(_UNCOMMITTED_ENTITIES, ()):
+            # Own uncommitted writes - must see them, and must not cache them
+            return await self._query_entity_page(entity_type, entity_id, company_id, skip, limit)
+
+        key = (entity_type, entity_id, company_id, skip, limit)
+        now = time.monotonic()
+        cached = _entity_page_cache.get(key)
+        if cached is None or now - cached[0] >= _ENTITY_PAGE_CACHE_TTL_SECONDS:
+            cached = (now, await self._query_entity_page(entity_type, entity_id, company_id, skip, limit))
+            _cache_entity_page(key, cached[1], now)
+
+        rows, total = cached[1]
+        return list(rows), total  # Copy - callers can't alter the cached page
+
+    async def _query_entity_page(
+        self,
+        entity_type: EntityType,
+        entity_id: str,
+        company_id: str | None,
+        skip: int,
+        limit: int
+    ) -> tuple[list[Row], int]:
+        """Uncached get_entity_page."""
         conditions = [
             AuditLog.entity_type == entity_type,
             AuditLog.entity_id == entity_id
         ]
 
-        # Apply company filter for non-system admins
         if company_id is not None:
             conditions.append(AuditLog.company_id == uuid.UUID(company_id))
 
         query = (
-            select(AuditLog)
+            select(audit_logs, func.count().over().label("total"))
             .where(and_(*conditions))
-            .options(selectinload(AuditLog.user))
             .order_by(AuditLog.timestamp.desc())
             .offset(skip)
             .limit(limit)
         )
 
         result = await self.db.execute(query)
-        return list(result.scalars().all())
+        rows = list(result.all())
+        if rows or not skip:
+            return rows, rows[0].total if rows else 0
+        # Past the last page - no row carries the total, count it separately
+        return rows, await self.count_by_entity(entity_type, entity_id, company_id)
 
     async def count_all(self, company_id: str | None = None) -> int:
         """
@@ -98,9 +194,8 @@ class AuditLogRepository:
         Args:
             company_id: Filter by company (None = system admin, sees all)
         """
-        from sqlalchemy import func
-
-        query = select(func.count(AuditLog.id))
+        # count(*), not count(id) - answerable from the composite indexes alone
+        query = select(func.count()).select_from(audit_logs)
 
         if company_id is not None:
             query = query.where(AuditLog.company_id == uuid.UUID(company_id))
@@ -122,8 +217,6 @@ class AuditLogRepository:
             entity_id: ID of the specific entity
             company_id: Filter by company (None = system admin, sees all)
         """
-        from sqlalchemy import func
-
         conditions = [
             AuditLog.entity_type == entity_type,
             AuditLog.entity_id == entity_id
@@ -132,7 +225,7 @@ class AuditLogRepository:
         if company_id is not None:
             conditions.append(AuditLog.company_id == uuid.UUID(company_id))
 
-        query = select(func.count(AuditLog.id)).where(and_(*conditions))
+        query = select(func.count()).select_from(audit_logs).where(and_(*conditions))
 
         result = await self.db.execute(query)
         return result.scalar() or 0
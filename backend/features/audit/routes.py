@@ -1,6 +1,7 @@
 """Audit logs routes - System Admin and Company Admin."""
 from typing import Annotated
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
 from features.audit.schemas import AuditLogResponse, AuditLogListResponse
 from features.audit.service import AuditService
 from features.audit.dependencies import get_audit_service
@@ -10,7 +11,12 @@ from features.authorization.permissions import Permission
 from core.enums import EntityType
 
 
-router = APIRouter(prefix="/audit-logs", tags=["Audit Logs"])
+# Audit listings can be hundreds of rows - serialize them with orjson
+router = APIRouter(
+    prefix="/audit-logs",
+    tags=["Audit Logs"],
+    default_response_class=ORJSONResponse,
+)
 
 
 # ============================================================================
@@ -35,13 +41,12 @@ async def get_all_audit_logs(
     # Check permission
     require_permission(current_user, Permission.VIEW_AUDIT_LOGS)
 
-    # Get logs with multi-tenancy filtering (handled in service)
-    logs = await audit_service.get_all_logs(
+    # Get logs + total with multi-tenancy filtering (handled in service)
+    logs, total = await audit_service.get_logs_page(
         current_user=current_user,
         skip=skip,
         limit=limit
     )
-    total = await audit_service.count_all_logs(current_user)
 
     return AuditLogListResponse(
         items=[
@@ -84,19 +89,14 @@ async def get_entity_audit_logs(
     # Check permission
     require_permission(current_user, Permission.VIEW_AUDIT_LOGS)
 
-    # Get entity logs with multi-tenancy filtering (handled in service)
-    logs = await audit_service.get_entity_logs(
+    # Get entity logs + total with multi-tenancy filtering (handled in service)
+    logs, total = await audit_service.get_entity_logs_page(
         current_user=current_user,
         entity_type=entity_type,
         entity_id=entity_id,
         skip=skip,
         limit=limit
     )
-    total = await audit_service.count_entity_logs(
-        current_user=current_user,
-        entity_type=entity_type,
-        entity_id=entity_id
-    )
 
     return AuditLogListResponse(
         items=[
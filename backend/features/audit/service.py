@@ -1,6 +1,7 @@
 """Service layer for audit logs - business logic."""
 import json
 from typing import Any
+from sqlalchemy import Row
 from features.audit.models import AuditLog
 from features.audit.repository import AuditLogRepository
 from features.users.models import User
@@ -15,8 +16,9 @@ class AuditService:
     multi-tenancy filtering.
     """
 
-    # Fields to exclude from audit logs (sensitive data)
-    SENSITIVE_FIELDS = {
+    # Fields to exclude from audit logs (sensitive data) - lowercase, matched
+    # against key.lower(); immutable so callers and tests can share it safely
+    SENSITIVE_FIELDS = frozenset({
         "hashed_password",
         "password_hash",
         "password",
@@ -24,7 +26,7 @@ class AuditService:
         "refresh_token",
         "secret",
         "api_key",
-    }
+    })
 
     def __init__(self, repository: AuditLogRepository) -> None:
         self.repository = repository
@@ -172,93 +174,43 @@ class AuditService:
 
         return await self.repository.save(audit_log)
 
-    async def get_all_logs(
-        self,
-        current_user: User,
-        skip: int = 0,
-        limit: int = 100
-    ) -> list[AuditLog]:
+    def _visible_company_id(self, current_user: User) -> str | None:
         """
-        Get all audit logs with multi-tenancy filtering.
+        Company whose logs the user may see - None means all companies.
 
         System admin: sees all logs
-        Company admin: sees only their company's logs
+        Company users: see only their company's logs
         """
-        # System admin sees all
         if current_user.role == UserRole.SYSTEM_ADMIN:
-            return await self.repository.get_all(
-                company_id=None,
-                skip=skip,
-                limit=limit
-            )
+            return None
+        return str(current_user.company_id) if current_user.company_id else None
 
-        # Company users see only their company's logs
-        company_id = str(current_user.company_id) if current_user.company_id else None
-        return await self.repository.get_all(
-            company_id=company_id,
+    async def get_logs_page(
+        self,
+        current_user: User,
+        skip: int = 0,
+        limit: int = 100
+    ) -> tuple[list[Row], int]:
+        """Get one page of audit logs and the total, with multi-tenancy filtering."""
+        return await self.repository.get_page(
+            company_id=self._visible_company_id(current_user),
             skip=skip,
             limit=limit
         )
 
-    async def get_entity_logs(
+    async def get_entity_logs_page(
         self,
         current_user: User,
         entity_type: EntityType,
         entity_id: str,
         skip: int = 0,
         limit: int = 100
-    ) -> list[AuditLog]:
-        """
-        Get audit logs for a specific entity with multi-tenancy filtering.
-
-        System admin: sees all entity logs
-        Company admin: sees only their company's entity logs
-        """
-        # System admin sees all
-        if current_user.role == UserRole.SYSTEM_ADMIN:
-            return await self.repository.get_by_entity(
-                entity_type=entity_type,
-                entity_id=entity_id,
-                company_id=None,
-                skip=skip,
-                limit=limit
-            )
-
-        # Company users see only their company's logs
-        company_id = str(current_user.company_id) if current_user.company_id else None
-        return await self.repository.get_by_entity(
+    ) -> tuple[list[Row], int]:
+        """Get one page of an entity's audit logs and the total, with multi-tenancy filtering."""
+        return await self.repository.get_entity_page(
             entity_type=entity_type,
             entity_id=entity_id,
-            company_id=company_id,
+            company_id=self._visible_company_id(current_user),
             skip=skip,
             limit=limit
         )
-
-    async def count_all_logs(self, current_user: User) -> int:
-        """Count total audit logs with multi-tenancy filtering."""
-        if current_user.role == UserRole.SYSTEM_ADMIN:
-            return await self.repository.count_all(company_id=None)
-
-        company_id = str(current_user.company_id) if current_user.company_id else None
-        return await self.repository.count_all(company_id=company_id)
-
-    async def count_entity_logs(
-        self,
-        current_user: User,
-        entity_type: EntityType,
-        entity_id: str
-    ) -> int:
-        """Count audit logs for specific entity with multi-tenancy filtering."""
-        if current_user.role == UserRole.SYSTEM_ADMIN:
-            return await self.repository.count_by_entity(
-                entity_type=entity_type,
-                entity_id=entity_id,
-                company_id=None
-            )
-
-        company_id = str(current_user.company_id) if current_user.company_id else None
-        return await self.repository.count_by_entity(
-            entity_type=entity_type,
-            entity_id=entity_id,
-            company_id=company_id
-        )
@@ -30,7 +30,6 @@ class RefreshTokenRepository:
         )
         self.db.add(token)
         await self.db.flush()
-        await self.db.refresh(token)
         return token
 
     async def get_by_token_id(self, token_id: str) -> RefreshToken | None:
@@ -17,8 +17,8 @@ class CompanyRepository:
         """Create new company."""
         company = Company(name=name)
         self.db.add(company)
+        # id and timestamps are client-side defaults - populated by flush, no refresh needed
         await self.db.flush()
-        await self.db.refresh(company)
         return company
 
     async def get_by_id(self, company_id: str) -> Company | None:
@@ -61,18 +61,15 @@ class CompanyRepository:
         if is_active is not None:
             update_data["is_active"] = is_active
 
-        # Update
-        await self.db.execute(
+        # Update and read back the row in one round-trip (UPDATE ... RETURNING)
+        result = await self.db.execute(
             update(Company)
             .where(Company.id == company_id)
             .values(**update_data)
+            .returning(Company)
+            .execution_options(populate_existing=True)
         )
-
-        # Flush to ensure changes are visible
-        await self.db.flush()
-
-        # Return updated company
-        return await self.get_by_id(company_id)
+        return result.scalar_one_or_none()
 
     async def delete(self, company_id: str) -> bool:
         """Delete company (cascade deletes users)."""
@@ -37,8 +37,9 @@ class ProductRepository(CompanyAwareRepository[Product]):
             Created product
         """
         self.db.add(product)
+        # id, defaults and timestamps are client-side - the flush inside commit
+        # populates them, so no refresh SELECT is needed
         await self.db.commit()
-        await self.db.refresh(product)
         return product
 
     async def update(self, product: Product) -> Product:
@@ -51,8 +52,8 @@ class ProductRepository(CompanyAwareRepository[Product]):
         Returns:
             Updated product
         """
+        # updated_at is a client-side onupdate - set on the instance by the flush
         await self.db.commit()
-        await self.db.refresh(product)
         return product
 
     async def delete(self, product: Product) -> None:
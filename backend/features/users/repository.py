@@ -24,7 +24,7 @@ class UserRepository:
     ) -> User:
         """Create new user with multi-tenancy support."""
         from core.enums import UserRole
-        from sqlalchemy.orm import selectinload
+        from sqlalchemy.orm import joinedload
         user = User(
             name=name,
             phone_number=phone_number,
@@ -38,41 +38,40 @@ class UserRepository:
         result = await self.db.execute(
             select(User)
             .where(User.id == user.id)
-            .options(selectinload(User.company))
+            .options(joinedload(User.company))
         )
         return result.scalar_one()
 
     async def save(self, user: User) -> User:
         """Save user model to database."""
-        from sqlalchemy.orm import selectinload
+        from sqlalchemy.orm import joinedload
         self.db.add(user)
         await self.db.flush()
-        await self.db.refresh(user, attribute_names=['company'])
         # Eagerly load company relationship to avoid lazy loading issues
         result = await self.db.execute(
             select(User)
             .where(User.id == user.id)
-            .options(selectinload(User.company))
+            .options(joinedload(User.company))
         )
         return result.scalar_one()
 
     async def get_by_phone(self, phone_number: str) -> User | None:
         """Get user by phone number."""
-        from sqlalchemy.orm import selectinload
+        from sqlalchemy.orm import joinedload
         result = await self.db.execute(
             select(User)
             .where(User.phone_number == phone_number)
-            .options(selectinload(User.company))  # Eagerly load company for status check
+            .options(joinedload(User.company))  # Company in the same SELECT (one round-trip) for status check
         )
         return result.scalar_one_or_none()
 
     async def get_by_id(self, user_id: str) -> User | None:
         """Get user by ID."""
-        from sqlalchemy.orm import selectinload
+        from sqlalchemy.orm import joinedload
         result = await self.db.execute(
             select(User)
             .where(User.id == user_id)
-            .options(selectinload(User.company))  # Eagerly load company for status check
+            .options(joinedload(User.company))  # Company in the same SELECT (one round-trip) for status check
         )
         return result.scalar_one_or_none()
 
@@ -112,13 +111,13 @@ class UserRepository:
 
     async def update(self, user: User) -> User:
         """Update user."""
-        from sqlalchemy.orm import selectinload
+        from sqlalchemy.orm import joinedload
         await self.db.flush()
         # Eagerly load company relationship to avoid lazy loading issues
         result = await self.db.execute(
             select(User)
             .where(User.id == user.id)
-            .options(selectinload(User.company))
+            .options(joinedload(User.company))
         )
         return result.scalar_one()
 
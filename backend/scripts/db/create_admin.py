@@ -3,7 +3,7 @@
 
 Usage:
     cd backend
-    python scripts/admin/create_admin.py
+    python scripts/db/create_admin.py
 
 Creates admin with:
     Phone: 07701791983
@@ -17,11 +17,14 @@ from pathlib import Path
 backend_dir = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(backend_dir))
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from core.database import AsyncSessionLocal, init_db
+from features.users.models import User
 from features.users.repository import UserRepository
-from features.users.service import UserService
 from core.enums import UserRole
 from core.exceptions import PhoneAlreadyExistsException
+from core.security import hash_password, normalize_phone_number
 from features.auth.models import RefreshToken  # Required for SQLAlchemy relationship resolution
 
 
@@ -31,6 +34,30 @@ ADMIN_PHONE = "07701791983"
 ADMIN_PASSWORD = "Admin789"
 
 
+async def create_system_admin(session: AsyncSession, hashed_password: str) -> User:
+    """
+    Add the system admin to the session (flushed, not committed).
+
+    Shared by this script and setup_all.py. Takes a pre-hashed password so
+    callers can hash it alongside other bcrypt work.
+
+    Raises:
+        PhoneAlreadyExistsException: Admin phone number already exists
+    """
+    user_repo = UserRepository(session)
+    phone_number = normalize_phone_number(ADMIN_PHONE)
+    if await user_repo.phone_exists(phone_number):
+        raise PhoneAlreadyExistsException()
+
+    return await user_repo.create(
+        name=ADMIN_NAME,
+        phone_number=phone_number,
+        hashed_password=hashed_password,
+        company_id=None,  # System admin has no company
+        role=UserRole.SYSTEM_ADMIN.value,
+    )
+
+
 async def create_admin():
     """Create system admin with hardcoded credentials."""
     print("=" * 70)
@@ -43,19 +70,8 @@ async def create_admin():
 
     async with AsyncSessionLocal() as session:
         try:
-            # Create service
-            user_repo = UserRepository(session)
-            user_service = UserService(user_repo)
-
-            # Create admin using service
             print("Creating system admin...")
-            user = await user_service.create_user(
-                name=ADMIN_NAME,
-                phone_number=ADMIN_PHONE,
-                password=ADMIN_PASSWORD,
-                company_id=None,  # System admin has no company
-                role=UserRole.SYSTEM_ADMIN.value,
-            )
+            user = await create_system_admin(session, hash_password(ADMIN_PASSWORD))
             await session.commit()
 
             print()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Create upcoming monthly audit log partitions (PostgreSQL only).
+
+Usage:
+    cd backend
+    python scripts/db/create_partitions.py
+
+Schedule this (e.g. a monthly cron). The audit_logs table is range-partitioned
+by month and create_all only creates partitions for the next 12 months; after
+that, rows land in audit_logs_default, and a month's partition can no longer
+be created while DEFAULT holds rows for it.
+
+Creates audit_logs itself (partitioned) if it is missing, which is also the
+conversion step for databases created before partitioning - see README.md.
+
+Safe to re-run - existing partitions are left untouched.
+"""
+import asyncio
+import sys
+from pathlib import Path
+from sqlalchemy import text
+
+# Add backend directory to Python path
+backend_dir = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from core.database import engine
+from features.audit.models import AuditLog, CREATE_AUDIT_LOG_PARTITIONS
+# Tables audit_logs references, so its foreign keys resolve
+from features.users.models import User  # noqa: F401
+from features.company.models import Company  # noqa: F401
+
+
+async def create_partitions():
+    """Create the partitions for the current month and the next 12."""
+    if engine.dialect.name != "postgresql":
+        print(f"⏭️  {engine.dialect.name} has no table partitioning - nothing to do")
+        return 0
+
+    print("📋 Creating audit log partitions...")
+    async with engine.begin() as conn:
+        # No-op when the table exists; creating it also creates the partitions
+        await conn.run_sync(AuditLog.__table__.create, checkfirst=True)
+        await conn.execute(CREATE_AUDIT_LOG_PARTITIONS)
+        default_rows = await conn.scalar(text("SELECT count(*) FROM audit_logs_default"))
+    print("✅ Partitions created for the next 12 months")
+
+    if default_rows:
+        print(
+            f"⚠️  audit_logs_default holds {default_rows} row(s) - move them into "
+            "monthly partitions, or those months' partitions cannot be created"
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    exit_code = asyncio.run(create_partitions())
+    sys.exit(exit_code)
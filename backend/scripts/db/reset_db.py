@@ -3,36 +3,87 @@
 
 Usage:
     cd backend
-    python scripts/db/reset_db.py
+    python scripts/db/reset_db.py [--yes]
+
+Pass --yes / -y (or set CI=1 / FORCE=1) to skip the confirmation prompt.
 
 WARNING: This will DELETE ALL DATA!
 """
 import asyncio
+import os
 import sys
 from pathlib import Path
+from sqlalchemy import inspect, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
 
 # Add backend directory to Python path
 backend_dir = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(backend_dir))
 
-from core.database import engine, Base, init_db
+from core.database import engine, Base
+# Register every model on Base.metadata so create_all builds the full schema
+from features.users.models import User  # noqa: F401
+from features.auth.models import RefreshToken  # noqa: F401
+from features.company.models import Company  # noqa: F401
+from features.product.models import Product  # noqa: F401
+from features.audit.models import AuditLog  # noqa: F401
+
+
+def assume_yes() -> bool:
+    """--yes / -y on the command line, or CI / FORCE set in the environment."""
+    if {"--yes", "-y"} & set(sys.argv[1:]):
+        return True
+    return any(os.environ.get(name, "").lower() in ("1", "true", "yes") for name in ("CI", "FORCE"))
+
+
+async def confirm(prompt: str = "Continue? (yes/no): ") -> bool:
+    """Ask for confirmation without blocking the event loop (skipped by assume_yes)."""
+    if assume_yes():
+        print(f"{prompt}yes (non-interactive)")
+        return True
+    answer = await asyncio.to_thread(input, prompt)
+    return answer.lower() == 'yes'
+
 
+async def warm_up(bind: AsyncEngine) -> None:
+    """Open one pooled connection ahead of time so the first real query skips the handshake."""
+    async with bind.connect():
+        pass
 
-async def drop_all_tables():
-    """Drop all tables."""
+
+async def drop_all_tables(conn: AsyncConnection):
+    """Drop all tables on the given connection."""
     print("🗑️  Dropping all tables...")
-    async with engine.begin() as conn:
+    # Fresh databases (e.g. CI) have nothing to drop - one metadata query instead
+    table_names = await conn.run_sync(lambda sync_conn: inspect(sync_conn).get_table_names())
+    if not table_names:
+        print("✅ No tables to drop")
+        return
+
+    if conn.dialect.name == "postgresql":
+        # One statement instead of a DROP TABLE per table (also drops enum types)
+        await conn.execute(text("DROP SCHEMA IF EXISTS public CASCADE"))
+        await conn.execute(text("CREATE SCHEMA public"))
+    else:
         await conn.run_sync(Base.metadata.drop_all)
     print("✅ All tables dropped")
 
 
-async def create_all_tables():
-    """Create all tables."""
+async def create_all_tables(conn: AsyncConnection):
+    """Create all tables on the given connection."""
     print("📋 Creating tables...")
-    await init_db()
+    await conn.run_sync(Base.metadata.create_all)
     print("✅ Tables created")
 
 
+async def reset_schema():
+    """Drop and recreate all tables in one transaction on one connection."""
+    async with engine.begin() as conn:
+        await drop_all_tables(conn)
+        print()
+        await create_all_tables(conn)
+
+
 async def reset_database():
     """Reset database."""
     print("=" * 70)
@@ -42,10 +93,13 @@ async def reset_database():
     print("This will DELETE ALL DATA!")
     print()
 
-    confirm = input("Continue? (yes/no): ")
-    if confirm.lower() != 'yes':
+    # Connect while the user reads the prompt - the handshake is done by the time they answer
+    warmup = asyncio.create_task(warm_up(engine))
+    if not await confirm():
+        warmup.cancel()
         print("Cancelled.")
         return 0
+    await warmup
 
     print()
     print("=" * 70)
@@ -53,9 +107,7 @@ async def reset_database():
     print("=" * 70)
     print()
 
-    await drop_all_tables()
-    print()
-    await create_all_tables()
+    await reset_schema()
 
     print()
     print("=" * 70)
@@ -63,7 +115,7 @@ async def reset_database():
     print("=" * 70)
     print()
     print("Next steps:")
-    print("  1. Create admin: python scripts/admin/create_admin.py")
+    print("  1. Create admin: python scripts/db/create_admin.py")
     print("  2. Seed data:    python scripts/db/seed_data.py")
     print()
     print("Or run both:  python scripts/db/setup_all.py")
@@ -10,154 +10,432 @@ Reads from: scripts/db/seed_data.json (or seed_data.example.json)
 import asyncio
 import sys
 import json
+import os
+import time
 import uuid
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from collections import Counter
+from itertools import groupby, islice
+from operator import itemgetter
 from pathlib import Path
+from typing import Callable, Iterable, Iterator
 from datetime import datetime, timezone
 from decimal import Decimal
+from sqlalchemy import Index, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+try:
+    import orjson
+    json_loads = orjson.loads  # Much faster parser; raises a json.JSONDecodeError subclass
+except ImportError:
+    # Numeric literals come back as Decimal already - no float round-trip for prices
+    json_loads = partial(json.loads, parse_float=Decimal)
+
+try:
+    import ijson  # Optional: stream sections of very large seed files from disk
+except ImportError:
+    ijson = None
+
+# Parse errors from whichever JSON reader is in use
+SEED_JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError) if ijson else (json.JSONDecodeError,)
 
 # Add backend directory to Python path
 backend_dir = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(backend_dir))
 
-from core.database import AsyncSessionLocal
+from core.config import get_settings
 from core.enums import UserRole
+from core.security import hash_password, normalize_phone_number
 from features.company.models import Company
 from features.product.models import Product
-from features.company.repository import CompanyRepository
-from features.company.service import CompanyService
-from features.users.repository import UserRepository
-from features.users.service import UserService
-from features.product.repository import ProductRepository
-from features.product.service import ProductService
-from core.company_context import CompanyContext
+from features.users.models import User
 from features.auth.models import RefreshToken  # Required for SQLAlchemy relationship resolution
 
 
-async def seed_companies(companies_data: list[dict]) -> dict[str, Company]:
-    """Create companies from config data."""
-    async with AsyncSessionLocal() as session:
-        try:
-            # Create service
-            company_repo = CompanyRepository(session)
-            company_service = CompanyService(company_repo)
+# Rows per INSERT statement when streaming large sections
+SEED_BATCH_SIZE = 500
 
-            companies = {}
-            for data in companies_data:
-                company = await company_service.create_company(name=data["name"])
+# Seeding is one short-lived session: a single pooled connection, no overflow
+# and no pre-ping, instead of the application engine's pool. Multi-row
+# VALUES pages match the seed batch, so each batch is one statement.
+seed_engine = create_async_engine(
+    get_settings().DATABASE_URL,
+    pool_size=1,
+    max_overflow=0,
+    pool_pre_ping=False,
+    insertmanyvalues_page_size=SEED_BATCH_SIZE,
+)
+SeedSession = async_sessionmaker(seed_engine, expire_on_commit=False, autoflush=False)
 
-                # Update is_active if needed
-                if not data.get("is_active", True):
-                    company = await company_service.update_company(
-                        company_id=str(company.id),
-                        is_active=False
-                    )
+# Sort/group key for seed records that reference a company by name
+company_name_of = itemgetter("company_name")
 
-                companies[company.name] = company
+# Default cost_price, shared rather than parsed per product
+ZERO_PRICE = Decimal("0.00")
 
-            await session.commit()
+# Rows per batch from which asyncpg seeding switches to binary COPY
+COPY_THRESHOLD = 100
+
+# Role value -> enum member, resolved once instead of an Enum call per seeded user
+ROLE_BY_VALUE = {role.value: role for role in UserRole}
+
+
+def _uuid7() -> uuid.UUID:
+    """Time-ordered UUID (RFC 9562 version 7).
+
+    Seed IDs sort by creation time, so bulk inserts append to the right-hand
+    edge of the primary key index instead of touching random pages.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (
+        (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76                                  # version
+        | (rand >> 62 & 0xFFF) << 64                 # rand_a
+        | 0b10 << 62                                 # RFC 4122 variant
+        | rand & 0x3FFF_FFFF_FFFF_FFFF               # rand_b
+    )
+    return uuid.UUID(int=value)
 
-            print(f"✅ Created {len(companies)} companies:")
-            for company in companies.values():
-                print(f"   - {company.name}")
-
-            return companies
-        except Exception as e:
-            await session.rollback()
-            print(f"❌ Error creating companies: {e}")
-            raise
+
+# Python 3.14+ ships a native uuid7 (with a per-millisecond counter) - prefer it
+uuid7 = getattr(uuid, "uuid7", _uuid7)
 
 
-async def seed_users(users_data: list[dict], companies: dict[str, Company]) -> list:
-    """Create users from config data."""
-    async with AsyncSessionLocal() as session:
-        try:
-            # Create service
-            user_repo = UserRepository(session)
-            user_service = UserService(user_repo)
-
-            users = []
-            for data in users_data:
-                company = companies.get(data["company_name"])
-                if not company:
-                    print(f"⚠️  Skipping user {data['phone_number']} - company not found")
-                    continue
-
-                user = await user_service.create_user(
-                    name=data["name"],
-                    phone_number=data["phone_number"],
-                    password=data["password"],
-                    company_id=str(company.id),
-                    role=data.get("role", "viewer"),
-                    is_active=data.get("is_active", True),
-                )
-                users.append(user)
-
-            await session.commit()
-
-            print(f"✅ Created {len(users)} users:")
-            for user in users:
-                print(f"   - {user.name} - {user.phone_number} ({user.role.value})")
-
-            return users
-        except Exception as e:
-            await session.rollback()
-            print(f"❌ Error creating users: {e}")
-            raise
-
+def load_json_file(path: Path) -> dict:
+    """Parse a JSON file (uses orjson when installed)."""
+    with open(path, 'rb') as f:
+        return json_loads(f.read())
 
-async def seed_products(products_data: list[dict], companies: dict[str, Company]) -> list:
-    """Create products from config data."""
-    async with AsyncSessionLocal() as session:
-        try:
-            # Create service
-            product_repo = ProductRepository(session)
-            product_service = ProductService(product_repo)
-
-            # Create a system admin context for product creation
-            # System admin can create products for any company by specifying company_id
-            from features.users.models import User
-            system_admin = User(
-                id=uuid.uuid4(),
-                name="Seed Admin",
-                phone_number="+9647700000000",  # Dummy admin for seeding
-                hashed_password="dummy",
-                role=UserRole.SYSTEM_ADMIN,
-                is_active=True,
-            )
-            company_ctx = CompanyContext(user=system_admin)
-
-            products = []
-            for data in products_data:
-                company = companies.get(data["company_name"])
-                if not company:
-                    print(f"⚠️  Skipping product {data['name']} - company not found")
-                    continue
-
-                product = await product_service.create_product(
-                    company_ctx=company_ctx,
-                    name=data["name"],
-                    sku=data["sku"],
-                    selling_price=Decimal(str(data["selling_price"])),
-                    description=data.get("description"),
-                    cost_price=Decimal(str(data["cost_price"])) if data.get("cost_price") else None,
-                    stock_quantity=data.get("stock_quantity", 0),
-                    reorder_level=data.get("reorder_level", 10),
-                    company_id=company.id,
-                )
-                products.append(product)
 
-            await session.commit()
+def iter_jsonl(path: Path) -> Iterator[dict]:
+    """Stream records from a JSON Lines file (one object per line)."""
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield json_loads(line)
 
-            print(f"✅ Created {len(products)} products:")
-            for product in products:
-                status = "🔴" if product.stock_quantity <= product.reorder_level else "✅"
-                print(f"   - {product.name} (Stock: {product.stock_quantity}) {status}")
 
-            return products
-        except Exception as e:
-            await session.rollback()
-            print(f"❌ Error creating products: {e}")
-            raise
+def to_decimal(value) -> Decimal:
+    """Price from seed data: Decimal as-is, str parsed directly, float/int via str."""
+    if isinstance(value, Decimal):
+        return value
+    return Decimal(value if isinstance(value, str) else str(value))
+
+
+async def hash_seed_passwords(passwords: Iterable[str]) -> list[str]:
+    """
+    Hash seed passwords in parallel across CPU cores.
+
+    A one-off batch of bcrypt work is worth a process pool: workers never
+    contend for the interpreter, whatever the hashing backend does with the GIL.
+
+    Each distinct password is hashed once and the hash is reused for every
+    user sharing it (common in dev fixtures). Those users end up with the same
+    salt - fine for seed data, login still verifies normally.
+    """
+    passwords = list(passwords)
+    distinct = list(dict.fromkeys(passwords))
+    if not distinct:
+        return []
+
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(max_workers=min(len(distinct), os.cpu_count() or 1)) as pool:
+        hashes = await asyncio.gather(
+            *(loop.run_in_executor(pool, hash_password, password) for password in distinct)
+        )
+
+    hash_by_password = dict(zip(distinct, hashes))
+    return [hash_by_password[password] for password in passwords]
+
+
+def load_section(seed_file: Path, section) -> Iterable[dict]:
+    """
+    Resolve one seed section.
+
+    A section is either an inline list or the name of a sidecar file next to
+    seed_file: .jsonl files are streamed, anything else is parsed as JSON.
+    """
+    if not isinstance(section, str):
+        return section or []
+    path = seed_file.parent / section
+    return iter_jsonl(path) if path.suffix == ".jsonl" else load_json_file(path)
+
+
+def stream_section(seed_file: Path, name: str) -> Iterator[dict]:
+    """
+    Stream one top-level section of seed_file with ijson.
+
+    An inline array is yielded item by item (numbers come back as Decimal), so
+    only one record is in memory at a time; a sidecar file name is resolved
+    through load_section.
+    """
+    with open(seed_file, 'rb') as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix == name:
+                break
+        else:
+            return
+
+    if event == "string":
+        yield from load_section(seed_file, value)
+        return
+
+    with open(seed_file, 'rb') as f:
+        yield from ijson.items(f, f"{name}.item")
+
+
+def seed_sections(seed_file: Path) -> Callable[[str], Iterable[dict]]:
+    """
+    Return a reader for the top-level sections of seed_file.
+
+    With ijson installed each section is streamed from disk when it is read,
+    so the file is never parsed as a whole. Otherwise the file is parsed here
+    once and each section is popped from it as it is read.
+    """
+    if ijson is not None:
+        return partial(stream_section, seed_file)
+
+    config = load_json_file(seed_file)
+    return lambda name: load_section(seed_file, config.pop(name, []))
+
+
+async def use_async_commit(session: AsyncSession) -> None:
+    """
+    Don't wait for the WAL fsync when this transaction commits (PostgreSQL only).
+
+    Safe for seeding: every row is reproducible from seed_data.json, so a
+    crash mid-seed only means re-running the script.
+    """
+    if seed_engine.dialect.name == "postgresql":
+        await session.execute(text("SET LOCAL synchronous_commit = OFF"))
+
+
+async def drop_secondary_indexes(session: AsyncSession) -> list[Index]:
+    """
+    Drop the non-unique secondary indexes of the seeded tables (bulk-load pattern).
+
+    Building an index once over loaded rows is much cheaper than maintaining
+    it on every insert. Unique indexes (e.g. phone numbers) stay in place, so
+    a duplicate in the seed data fails on the offending insert rather than at
+    rebuild time. Returns the dropped indexes for create_indexes. Only for
+    freshly created, empty tables.
+    """
+    indexes = [
+        index
+        for model in (Company, User, Product)
+        for index in model.__table__.indexes
+        if not index.unique
+    ]
+    connection = await session.connection()
+    for index in indexes:
+        await connection.run_sync(index.drop)
+    return indexes
+
+
+async def create_indexes(session: AsyncSession, indexes: list[Index]) -> None:
+    """Rebuild indexes dropped by drop_secondary_indexes (in the same transaction)."""
+    connection = await session.connection()
+    for index in indexes:
+        await connection.run_sync(index.create)
+
+
+def copy_records(table, rows: list[dict], dialect) -> tuple[list[str], list[tuple]]:
+    """
+    Build the column list and records for a binary COPY of plain-dict rows.
+
+    COPY bypasses SQLAlchemy: columns the rows leave out get their Python
+    default (or NULL) here, unless only the server can supply one, and bind
+    processors (e.g. Enum -> name) are applied here.
+    """
+    getters = {}
+    for column in table.columns:
+        default = column.default
+        if column.name in rows[0]:
+            getters[column.name] = itemgetter(column.name)
+        elif default is not None and default.is_callable:
+            # SQLAlchemy wraps the callable to take an execution context
+            getters[column.name] = lambda row, arg=default.arg: arg(None)
+        elif default is not None and default.is_scalar:
+            getters[column.name] = lambda row, value=default.arg: value
+        elif column.server_default is None:
+            getters[column.name] = lambda row: None
+
+    columns = list(getters)
+    processors = [table.c[name].type.bind_processor(dialect) for name in columns]
+    records = [
+        tuple(
+            get(row) if process is None else process(get(row))
+            for get, process in zip(getters.values(), processors)
+        )
+        for row in rows
+    ]
+    return columns, records
+
+
+async def bulk_insert(session: AsyncSession, model, rows: list[dict]) -> None:
+    """
+    Insert plain-dict rows into a model's table.
+
+    On asyncpg, batches of COPY_THRESHOLD rows or more are sent with binary
+    COPY (copy_records_to_table) instead of a multi-row INSERT.
+    """
+    if not rows:
+        return
+    table = model.__table__
+    if seed_engine.dialect.driver != "asyncpg" or len(rows) < COPY_THRESHOLD:
+        # Core insert on the Table - no ORM bulk-save bookkeeping for these rows
+        await session.execute(table.insert(), rows)
+        return
+
+    columns, records = copy_records(table, rows, seed_engine.dialect)
+
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        table.name, records=records, columns=columns
+    )
+
+
+async def seed_companies(session: AsyncSession, companies_data: list[dict]) -> dict[str, uuid.UUID]:
+    """Create companies from config data with a single bulk insert.
+
+    Returns company name -> id, the only thing the later seeders look up.
+    """
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "id": uuid7(),
+            "name": data["name"],
+            "is_active": data.get("is_active", True),
+            "created_at": now,
+            "updated_at": now,
+        }
+        for data in companies_data
+    ]
+    await bulk_insert(session, Company, rows)
+
+    # IDs are generated client-side, so no refresh round-trip is needed
+    company_ids = {row["name"]: row["id"] for row in rows}
+
+    print(f"✅ Created {len(company_ids)} companies")
+
+    return company_ids
+
+
+def group_by_company(records: Iterable, company_ids: dict[str, uuid.UUID], skipped: Counter, key=company_name_of):
+    """
+    Yield (company_id, records) per company name, resolving each name once.
+
+    Records for unknown companies are counted in skipped instead, so callers
+    can warn once per missing company rather than once per row.
+    """
+    for name, group in groupby(sorted(records, key=key), key=key):
+        company_id = company_ids.get(name)
+        if company_id is None:
+            skipped[name] += sum(1 for _ in group)
+            continue
+        yield company_id, group
+
+
+def warn_skipped(kind: str, skipped: Counter) -> None:
+    """Print one warning per missing company."""
+    for name, count in skipped.items():
+        print(f"⚠️  Skipping {count} {kind} - company '{name}' not found")
+
+
+def build_user_rows(
+    users_data: list[dict],
+    company_ids: dict[str, uuid.UUID],
+    hashed_passwords: list[str],
+) -> list[dict]:
+    """
+    Build user rows from config data - pure CPU work, done before any session opens.
+
+    hashed_passwords lines up with users_data - callers hash up front (see
+    hash_seed_passwords) so bcrypt can overlap other seeding work.
+    """
+    now = datetime.now(timezone.utc)
+    skipped = Counter()
+    users = []
+    for company_id, group in group_by_company(
+        zip(users_data, hashed_passwords), company_ids, skipped, key=lambda pair: pair[0]["company_name"]
+    ):
+        for data, hashed_password in group:
+            # Plain dicts - no ORM instances built for insert-and-forget seed rows
+            users.append({
+                "id": uuid7(),
+                "name": data["name"],
+                "phone_number": normalize_phone_number(data["phone_number"]),
+                "hashed_password": hashed_password,
+                "email": data.get("email"),
+                "company_id": company_id,
+                "role": ROLE_BY_VALUE[data.get("role", "viewer")],
+                "is_active": data.get("is_active", True),
+                "created_at": now,
+                "updated_at": now,
+            })
+    warn_skipped("users", skipped)
+    return users
+
+
+async def seed_users(session: AsyncSession, users: list[dict]) -> list[dict]:
+    """Insert prebuilt user rows (see build_user_rows)."""
+    await bulk_insert(session, User, users)
+
+    print(f"✅ Created {len(users)} users")
+
+    return users
+
+
+def build_product_rows(
+    products_data: Iterable[dict],
+    company_ids: dict[str, uuid.UUID],
+    skipped: Counter,
+    now: datetime,
+) -> list[dict]:
+    """Build product rows for one batch; unknown companies are counted in skipped."""
+    return [
+        {
+            "id": uuid7(),
+            "company_id": company_id,
+            "name": data["name"],
+            "sku": data["sku"],
+            "description": data.get("description"),
+            "cost_price": to_decimal(data["cost_price"]) if data.get("cost_price") else ZERO_PRICE,
+            "selling_price": to_decimal(data["selling_price"]),
+            "stock_quantity": data.get("stock_quantity", 0),
+            "reorder_level": data.get("reorder_level", 10),
+            "is_active": data.get("is_active", True),
+            "created_at": now,
+            "updated_at": now,
+        }
+        for company_id, group in group_by_company(products_data, company_ids, skipped)
+        for data in group
+    ]
+
+
+async def seed_products(
+    session: AsyncSession,
+    products_data: Iterable[dict],
+    company_ids: dict[str, uuid.UUID],
+) -> int:
+    """Create products from config data, inserting SEED_BATCH_SIZE rows per statement."""
+    now = datetime.now(timezone.utc)
+    skipped = Counter()
+    created = 0
+    # Consume the source in batches so a streamed JSONL file is never fully in memory
+    rows = iter(products_data)
+    while batch := list(islice(rows, SEED_BATCH_SIZE)):
+        products = build_product_rows(batch, company_ids, skipped, now)
+
+        await bulk_insert(session, Product, products)
+        created += len(products)
+
+    warn_skipped("products", skipped)
+    print(f"✅ Created {created} products")
+    return created
 
 
 async def seed_all():
@@ -179,9 +457,11 @@ async def seed_all():
     print()
 
     try:
-        with open(seed_file, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-    except json.JSONDecodeError as e:
+        read_section = seed_sections(seed_file)
+        # Users are needed up front for hashing; the other sections are read
+        # only when their step runs
+        users_data = list(read_section("users"))
+    except SEED_JSON_ERRORS as e:
         print(f"❌ Invalid JSON: {e}")
         return 1
 
@@ -190,38 +470,65 @@ async def seed_all():
     print("=" * 70)
     print()
 
-    # Seed companies
-    companies_data = config.get("companies", [])
-    companies = {}
-    if companies_data:
-        print("🏢 Creating companies...")
-        companies = await seed_companies(companies_data)
-        print()
-
-    # Seed users
-    users_data = config.get("users", [])
-    if users_data and companies:
-        print("👥 Creating users...")
-        await seed_users(users_data, companies)
-        print()
-
-    # Seed products
-    products_data = config.get("products", [])
-    if products_data and companies:
-        print("📦 Creating products...")
-        await seed_products(products_data, companies)
-        print()
+    # bcrypt is CPU-bound - hash in worker processes while companies and
+    # products are inserted
+    hashing = asyncio.create_task(hash_seed_passwords(data["password"] for data in users_data))
+
+    # One session, one transaction: companies, products and users commit together
+    companies, users, products_created = {}, [], 0
+    async with SeedSession() as session:
+        try:
+            await use_async_commit(session)
+
+            companies_data = list(read_section("companies"))
+            if companies_data:
+                print("🏢 Creating companies...")
+                companies = await seed_companies(session, companies_data)
+                print()
+            del companies_data
+
+            if companies:
+                print("📦 Creating products...")
+                products_created = await seed_products(session, read_section("products"), companies)
+                print()
+
+            hashed_passwords = await hashing
+            if companies and users_data:
+                print("👥 Creating users...")
+                users = await seed_users(session, build_user_rows(users_data, companies, hashed_passwords))
+                print()
+
+            await session.commit()
+        except SEED_JSON_ERRORS as e:
+            # Companies and products are streamed, so a parse error can surface mid-transaction
+            await session.rollback()
+            print(f"❌ Invalid JSON: {e}")
+            return 1
+        except Exception as e:
+            await session.rollback()
+            print(f"❌ Error: {e}")
+            raise
+        finally:
+            if not hashing.done():
+                hashing.cancel()
 
     print("=" * 70)
     print("✅ SEEDING COMPLETE!")
     print("=" * 70)
     print()
-    print(f"Created: {len(companies)} companies, {len(users_data)} users, {len(products_data)} products")
+    print(f"Created: {len(companies)} companies, {len(users)} users, {products_created} products")
     print("=" * 70)
 
     return 0
 
 
+async def main() -> int:
+    try:
+        return await seed_all()
+    finally:
+        await seed_engine.dispose()
+
+
 if __name__ == "__main__":
-    exit_code = asyncio.run(seed_all())
+    exit_code = asyncio.run(main())
     sys.exit(exit_code)
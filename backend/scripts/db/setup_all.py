@@ -3,197 +3,44 @@
 
 Usage:
     cd backend
-    python scripts/db/setup_all.py
+    python scripts/db/setup_all.py [--yes]
+
+Pass --yes / -y (or set CI=1 / FORCE=1) to skip the confirmation prompt.
 
 This combines:
     1. Reset database (drop & recreate tables)
     2. Create system admin (07701791983 / Admin789)
     3. Seed sample data from seed_data.json
 
+The individual steps live in reset_db.py, create_admin.py and seed_data.py;
+this script runs them all - reset included - in a single transaction.
+
 WARNING: This will DELETE ALL DATA!
 """
 import asyncio
 import sys
-import json
-import uuid
 from pathlib import Path
-from datetime import datetime, timezone
-from decimal import Decimal
 
 # Add backend directory to Python path
 backend_dir = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(backend_dir))
 
-from core.database import AsyncSessionLocal, engine, Base, init_db
-from features.users.models import User
-from core.enums import UserRole
-from features.users.repository import UserRepository
-from features.company.models import Company
-from features.product.models import Product
-from features.auth.models import RefreshToken  # Required for SQLAlchemy relationship resolution
-
-
-# Hardcoded admin credentials
-ADMIN_PHONE = "07701791983"
-ADMIN_PASSWORD = "Admin789"
-
-
-async def drop_all_tables():
-    """Drop all tables."""
-    print("🗑️  Dropping all tables...")
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-    print("✅ Dropped")
-
-
-async def create_all_tables():
-    """Create all tables."""
-    print("📋 Creating tables...")
-    await init_db()
-    print("✅ Created")
-
-
-async def create_admin():
-    """Create system admin using service layer (follows architecture pattern)."""
-    print("👤 Creating system admin...")
-
-    async with AsyncSessionLocal() as session:
-        try:
-            # Use service layer - never bypass it
-            user_repo = UserRepository(session)
-            from features.users.service import UserService
-            user_service = UserService(user_repo)
-
-            user = await user_service.create_user(
-                name="System Admin",
-                phone_number=ADMIN_PHONE,
-                password=ADMIN_PASSWORD,
-                company_id=None,
-                role=UserRole.SYSTEM_ADMIN.value,
-            )
-            await session.commit()
-
-            print(f"✅ Admin created: {user.phone_number}")
-            return user
-        except Exception as e:
-            await session.rollback()
-            print(f"❌ Error creating admin: {e}")
-            raise
-
-
-async def seed_companies(companies_data: list[dict]) -> dict[str, Company]:
-    """Create companies using service layer (follows architecture pattern)."""
-    async with AsyncSessionLocal() as session:
-        try:
-            # Use service layer - never bypass it
-            from features.company.repository import CompanyRepository
-            from features.company.service import CompanyService
-
-            company_repo = CompanyRepository(session)
-            company_service = CompanyService(company_repo)
-
-            companies = {}
-            for data in companies_data:
-                company = await company_service.create_company(name=data["name"])
-
-                # Update is_active if needed
-                if not data.get("is_active", True):
-                    company = await company_service.update_company(
-                        company_id=str(company.id),
-                        is_active=False
-                    )
-
-                companies[company.name] = company
-
-            await session.commit()
-            print(f"✅ Created {len(companies)} companies")
-            return companies
-        except Exception as e:
-            await session.rollback()
-            raise
-
-
-async def seed_users(users_data: list[dict], companies: dict[str, Company]) -> list[User]:
-    """Create users using service layer (follows architecture pattern)."""
-    async with AsyncSessionLocal() as session:
-        try:
-            # Use service layer - never bypass it
-            user_repo = UserRepository(session)
-            from features.users.service import UserService
-            user_service = UserService(user_repo)
-
-            users = []
-            for data in users_data:
-                company = companies.get(data["company_name"])
-                if not company:
-                    continue
-
-                user = await user_service.create_user(
-                    name=data["name"],
-                    phone_number=data["phone_number"],
-                    password=data["password"],
-                    company_id=str(company.id),
-                    role=data.get("role", "viewer"),
-                    is_active=data.get("is_active", True),
-                )
-                users.append(user)
-
-            await session.commit()
-            print(f"✅ Created {len(users)} users")
-            return users
-        except Exception as e:
-            await session.rollback()
-            raise
-
-
-async def seed_products(products_data: list[dict], companies: dict[str, Company]) -> list[Product]:
-    """Create products using service layer (follows architecture pattern)."""
-    async with AsyncSessionLocal() as session:
-        try:
-            # Use service layer - never bypass it
-            from features.product.repository import ProductRepository
-            from features.product.service import ProductService
-            from core.company_context import CompanyContext
-
-            product_repo = ProductRepository(session)
-            product_service = ProductService(product_repo)
-
-            # Create system admin context for product creation
-            system_admin = User(
-                id=uuid.uuid4(),
-                name="Seed Admin",
-                phone_number="+9647700000000",
-                hashed_password="dummy",
-                role=UserRole.SYSTEM_ADMIN,
-                is_active=True,
-            )
-            company_ctx = CompanyContext(user=system_admin)
-
-            products = []
-            for data in products_data:
-                company = companies.get(data["company_name"])
-                if not company:
-                    continue
-
-                product = await product_service.create_product(
-                    company_ctx=company_ctx,
-                    name=data["name"],
-                    sku=data["sku"],
-                    selling_price=Decimal(str(data["selling_price"])),
-                    description=data.get("description"),
-                    cost_price=Decimal(str(data["cost_price"])) if data.get("cost_price") else None,
-                    stock_quantity=data.get("stock_quantity", 0),
-                    reorder_level=data.get("reorder_level", 10),
-                    company_id=company.id,
-                )
-                products.append(product)
-
-            await session.commit()
-            print(f"✅ Created {len(products)} products")
-            return products
-        except Exception as e:
-            await session.rollback()
-            raise
+from scripts.db.create_admin import ADMIN_PASSWORD, ADMIN_PHONE, create_system_admin
+from scripts.db.reset_db import confirm, create_all_tables, drop_all_tables, warm_up
+from scripts.db.seed_data import (
+    SEED_JSON_ERRORS,
+    SeedSession,
+    build_user_rows,
+    create_indexes,
+    drop_secondary_indexes,
+    hash_seed_passwords,
+    seed_companies,
+    seed_engine,
+    seed_products,
+    seed_sections,
+    seed_users,
+    use_async_commit,
+)
 
 
 async def setup_all():
@@ -208,10 +55,13 @@ async def setup_all():
     print("  3. Seed sample data from seed_data.json")
     print()
 
-    confirm = input("Continue? (yes/no): ")
-    if confirm.lower() != 'yes':
+    # Connect while the user reads the prompt - the handshake is done by the time they answer
+    warmup = asyncio.create_task(warm_up(seed_engine))
+    if not await confirm():
+        warmup.cancel()
         print("Cancelled.")
         return 0
+    await warmup
 
     print()
     print("=" * 70)
@@ -219,17 +69,7 @@ async def setup_all():
     print("=" * 70)
     print()
 
-    # Step 1: Reset database
-    await drop_all_tables()
-    print()
-    await create_all_tables()
-    print()
-
-    # Step 2: Create admin
-    await create_admin()
-    print()
-
-    # Step 3: Seed data
+    # Step 1: Load seed data - before the reset, so a broken file leaves the DB untouched
     script_dir = Path(__file__).parent
     seed_file = script_dir / "seed_data.json"
 
@@ -237,30 +77,83 @@ async def setup_all():
         print(f"📂 Loading seed data from: {seed_file.name}")
         print()
 
-        with open(seed_file, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-
-        companies_data = config.get("companies", [])
-        users_data = config.get("users", [])
-        products_data = config.get("products", [])
+        try:
+            read_section = seed_sections(seed_file)
+            # Users are needed up front for hashing; the other sections are
+            # read (and released) step by step below
+            users_data = list(read_section("users"))
+        except SEED_JSON_ERRORS as e:
+            print(f"❌ Invalid JSON: {e}")
+            return 1
+    else:
+        print("⚠️  No seed data file found - skipping sample data")
+        print()
+        read_section = lambda name: []
+        users_data = []
+
+    # Step 2: Reset, create admin and seed data in one session / one transaction.
+    # DDL is transactional on PostgreSQL, so a failed seed leaves the old data
+    # in place. bcrypt is CPU-bound - hash every password in worker processes
+    # while the schema is rebuilt and company/product rows are inserted
+    hashing = asyncio.create_task(
+        hash_seed_passwords([ADMIN_PASSWORD, *(data["password"] for data in users_data)])
+    )
+
+    async with SeedSession() as session:
+        try:
+            await use_async_commit(session)
 
-        if companies_data:
-            print("🏢 Seeding companies...")
-            companies = await seed_companies(companies_data)
+            connection = await session.connection()
+            await drop_all_tables(connection)
+            print()
+            await create_all_tables(connection)
             print()
 
-            if users_data:
-                print("👥 Seeding users...")
-                await seed_users(users_data, companies)
+            # Tables were just created empty - load first, index once at the end
+            indexes = await drop_secondary_indexes(session)
+
+            companies = {}
+            companies_data = list(read_section("companies"))
+            if companies_data:
+                print("🏢 Seeding companies...")
+                companies = await seed_companies(session, companies_data)
                 print()
+            del companies_data
 
-            if products_data:
+            if companies:
                 print("📦 Seeding products...")
-                await seed_products(products_data, companies)
+                await seed_products(session, read_section("products"), companies)
+                print()
+
+            admin_hash, *user_hashes = await hashing
+
+            print("👤 Creating system admin...")
+            admin = await create_system_admin(session, admin_hash)
+            print(f"✅ Admin created: {admin.phone_number}")
+            print()
+
+            if companies and users_data:
+                print("👥 Seeding users...")
+                await seed_users(session, build_user_rows(users_data, companies, user_hashes))
                 print()
-    else:
-        print("⚠️  No seed data file found - skipping sample data")
-        print()
+
+            print("🗂️  Rebuilding indexes...")
+            await create_indexes(session, indexes)
+            print()
+
+            await session.commit()
+        except SEED_JSON_ERRORS as e:
+            # Companies and products are streamed, so a parse error can surface mid-transaction
+            await session.rollback()
+            print(f"❌ Invalid JSON: {e}")
+            return 1
+        except Exception as e:
+            await session.rollback()
+            print(f"❌ Error: {e}")
+            raise
+        finally:
+            if not hashing.done():
+                hashing.cancel()
 
     print("=" * 70)
     print("✅ SETUP COMPLETE!")
@@ -275,6 +168,13 @@ async def setup_all():
     return 0
 
 
+async def main() -> int:
+    try:
+        return await setup_all()
+    finally:
+        await seed_engine.dispose()
+
+
 if __name__ == "__main__":
-    exit_code = asyncio.run(setup_all())
+    exit_code = asyncio.run(main())
     sys.exit(exit_code)
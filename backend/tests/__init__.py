@@ -1 +0,0 @@
-"""Test suite for TabletsV2 backend."""
@@ -1,8 +1,21 @@
 """Pytest configuration and fixtures for backend tests."""
+import asyncio
+import os
+import uuid
+import bcrypt
 import pytest
+from functools import lru_cache, partial
+from types import SimpleNamespace
 from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.pool import NullPool
+from sqlalchemy import event, insert
+from sqlalchemy.pool import StaticPool
+from pytest_asyncio import is_async_test
+
+# Cheap KDF / required settings for modules that read settings at import time
+# (core.security binds its bcrypt cost then) - must run before any project import
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+os.environ.setdefault("JWT_SECRET_KEY", "test-secret-key-for-testing-only-not-for-production")
 
 from core.database import Base
 from core.config import Settings, get_settings
@@ -10,7 +23,7 @@ from core.security import hash_password
 
 # Import all models so SQLAlchemy can map relationships
 from features.users.models import User
-from core.enums import UserRole
+from core.enums import AuditAction, EntityType, UserRole
 from features.auth.models import RefreshToken
 from features.company.models import Company
 from features.product.models import Product
@@ -23,6 +36,29 @@ from features.auth.auth_services import AuthService
 from features.company.repository import CompanyRepository
 from features.audit.repository import AuditLogRepository
 
+try:  # uvloop ships with uvicorn[standard] (not on Windows)
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+# ============================================================================
+# Event Loop
+# ============================================================================
+
+def pytest_collection_modifyitems(items):
+    """Run every async test in the one session-wide event loop (no loop per test)."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run the async tests on uvloop when it is installed."""
+    return uvloop.EventLoopPolicy() if uvloop else asyncio.DefaultEventLoopPolicy()
+
 
 # ============================================================================
 # Test Settings
@@ -34,8 +70,8 @@ def test_settings() -> Settings:
     return Settings(
         APP_NAME="TabletsV2 Test",
         DEBUG=True,
-        # File-based test DB with transaction rollback for isolation
-        DATABASE_URL="sqlite+aiosqlite:///./test.db",
+        # In-memory test DB (one shared StaticPool connection) with transaction rollback for isolation
+        DATABASE_URL="sqlite+aiosqlite:///:memory:",
         JWT_SECRET_KEY="test-secret-key-for-testing-only-not-for-production",
         JWT_ALGORITHM="HS256",
         ACCESS_TOKEN_EXPIRE_MINUTES=30,
@@ -55,10 +91,21 @@ def override_settings(test_settings: Settings):
 
     # Monkey-patch the settings
     import core.config
+    import core.security
     original_get_settings = core.config.get_settings
     core.config.get_settings = lambda: test_settings
 
-    yield
+    # core.security read its settings (and bound the bcrypt cost) at import,
+    # before this fixture ran - point it at the test settings too so every
+    # hash_password call in the run uses BCRYPT_ROUNDS=4
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(core.security, "settings", test_settings)
+        mp.setattr(
+            core.security,
+            "_gensalt",
+            partial(bcrypt.gensalt, rounds=test_settings.BCRYPT_ROUNDS),
+        )
+        yield
 
     # Restore original
     core.config.get_settings = original_get_settings
@@ -74,9 +121,30 @@ async def test_engine(test_settings: Settings):
     engine = create_async_engine(
         test_settings.DATABASE_URL,
         echo=False,
-        poolclass=NullPool,  # No connection pooling for tests
+        # One shared connection for the whole run - db_session's transaction
+        # rollback isolates tests, so there is no need to reconnect per test
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
     )
 
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        # Tests are not durability-sensitive - keep journaling and temp data in RAM
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA locking_mode=EXCLUSIVE")
+        cursor.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache (default is ~2 MiB)
+        cursor.close()
+        # Let SQLAlchemy drive transactions itself (the driver's implicit BEGIN
+        # breaks SAVEPOINT) - see the "begin" listener below
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _begin_transaction(conn):
+        conn.exec_driver_sql("BEGIN")
+
     # Create all tables
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -98,11 +166,14 @@ async def db_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
         # Begin a transaction
         trans = await connection.begin()
 
-        # Create session bound to the transaction
+        # Create session bound to the transaction. Session commit/rollback only
+        # release/roll back a SAVEPOINT, so nothing reaches disk and the outer
+        # transaction below still undoes everything the test wrote
         async_session = async_sessionmaker(
             bind=connection,
             class_=AsyncSession,
             expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
         )
 
         async with async_session() as session:
@@ -165,13 +236,37 @@ async def test_company(company_repo: CompanyRepository) -> Company:
 # Data Fixtures - Users
 # ============================================================================
 
+@lru_cache(maxsize=None)
+def cached_hash(password: str) -> str:
+    """bcrypt hash of a fixture password - computed once per test run, not per test."""
+    return hash_password(password)
+
+
+@pytest.fixture(scope="session")
+def test_password_hash() -> str:
+    """Hash of the regular test user's password (session-scoped)."""
+    return cached_hash("TestPassword123")
+
+
+@pytest.fixture(scope="session")
+def admin_password_hash() -> str:
+    """Hash of the company admin's password (session-scoped)."""
+    return cached_hash("AdminPassword123")
+
+
+@pytest.fixture(scope="session")
+def system_admin_password_hash() -> str:
+    """Hash of the system admin's password (session-scoped)."""
+    return cached_hash("SystemAdminPassword123")
+
+
 @pytest.fixture
-async def test_user(user_repo: UserRepository, test_company: Company) -> User:
+async def test_user(user_repo: UserRepository, test_company: Company, test_password_hash: str) -> User:
     """Create regular test user with viewer role."""
     user = await user_repo.create(
         name="Test User",
         phone_number="9647700000001",
-        hashed_password=hash_password("TestPassword123"),
+        hashed_password=test_password_hash,
         company_id=str(test_company.id),
         role="viewer",
     )
@@ -179,12 +274,12 @@ async def test_user(user_repo: UserRepository, test_company: Company) -> User:
 
 
 @pytest.fixture
-async def test_admin_user(user_repo: UserRepository, test_company: Company) -> User:
+async def test_admin_user(user_repo: UserRepository, test_company: Company, admin_password_hash: str) -> User:
     """Create admin test user."""
     user = await user_repo.create(
         name="Admin User",
         phone_number="9647700000002",
-        hashed_password=hash_password("AdminPassword123"),
+        hashed_password=admin_password_hash,
         company_id=str(test_company.id),
         role="company_admin",
     )
@@ -192,18 +287,90 @@ async def test_admin_user(user_repo: UserRepository, test_company: Company) -> U
 
 
 @pytest.fixture
-async def test_system_admin(user_repo: UserRepository) -> User:
+async def test_system_admin(user_repo: UserRepository, system_admin_password_hash: str) -> User:
     """Create system admin test user."""
     user = await user_repo.create(
         name="System Admin",
         phone_number="9647700000000",
-        hashed_password=hash_password("SystemAdminPassword123"),
+        hashed_password=system_admin_password_hash,
         company_id=None,
         role="system_admin",
     )
     return user
 
 
+@pytest.fixture
+async def seed_bundle(
+    db_session: AsyncSession,
+    test_password_hash: str,
+    admin_password_hash: str,
+    system_admin_password_hash: str,
+) -> SimpleNamespace:
+    """
+    Company plus one user of each kind, inserted with one add_all + flush.
+
+    Same data as test_company/test_user/test_admin_user/test_system_admin, for
+    tests that need several of them without a round-trip per fixture.
+    """
+    company = Company(name="Test Company")
+    user = User(
+        name="Test User",
+        phone_number="9647700000001",
+        hashed_password=test_password_hash,
+        company=company,
+        role=UserRole.VIEWER,
+    )
+    admin = User(
+        name="Admin User",
+        phone_number="9647700000002",
+        hashed_password=admin_password_hash,
+        company=company,
+        role=UserRole.COMPANY_ADMIN,
+    )
+    system_admin = User(
+        name="System Admin",
+        phone_number="9647700000000",
+        hashed_password=system_admin_password_hash,
+        company_id=None,
+        role=UserRole.SYSTEM_ADMIN,
+    )
+    db_session.add_all([company, user, admin, system_admin])
+    await db_session.flush()
+    return SimpleNamespace(company=company, user=user, admin=admin, system_admin=system_admin)
+
+
+# ============================================================================
+# Data Fixtures - Audit Logs
+# ============================================================================
+
+@pytest.fixture
+async def audit_dataset(db_session: AsyncSession, seed_bundle: SimpleNamespace) -> SimpleNamespace:
+    """
+    seed_bundle plus four audit logs, inserted with one executemany INSERT.
+
+    Three logs belong to the company (two by the user, one by the admin) and
+    one is a system admin action with no company. Shared by the filter tests.
+    """
+    def log(entity_type: EntityType, action: AuditAction, actor: User) -> dict:
+        return {
+            "entity_type": entity_type,
+            "entity_id": str(uuid.uuid4()),
+            "action": action,
+            "changes": "{}",
+            "user_id": actor.id,
+            "username": actor.name,
+            "company_id": actor.company_id,
+        }
+
+    await db_session.execute(insert(AuditLog), [
+        log(EntityType.USER, AuditAction.CREATE, seed_bundle.user),
+        log(EntityType.PRODUCT, AuditAction.UPDATE, seed_bundle.user),
+        log(EntityType.PRODUCT, AuditAction.DELETE, seed_bundle.admin),
+        log(EntityType.COMPANY, AuditAction.CREATE, seed_bundle.system_admin),
+    ])
+    return seed_bundle
+
+
 # ============================================================================
 # Test Credentials
 # ============================================================================
@@ -1,12 +1,22 @@
 """Integration tests for audit repository."""
+import os
 import pytest
-from uuid import uuid4
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from features.audit.repository import AuditLogRepository
 from features.audit.models import AuditLog
 from features.users.models import User
 from core.enums import AuditAction, EntityType
 
 
+def uuid_batch(n: int) -> list[UUID]:
+    """n random (version 4) UUIDs from a single os.urandom call."""
+    buf = os.urandom(16 * n)
+    return [UUID(bytes=buf[i * 16:(i + 1) * 16], version=4) for i in range(n)]
+
+
 class TestAuditLogRepository:
     """Test AuditLogRepository with real database."""
 
@@ -34,76 +44,39 @@ class TestAuditLogRepository:
         assert result.username == test_user.name
 
     @pytest.mark.asyncio
-    async def test_get_all_no_filter(
+    @pytest.mark.parametrize(
+        "filter_by_company, expected",
+        [(False, 4), (True, 3)],
+        ids=["no_filter", "company_filter"],
+    )
+    async def test_get_all_filtered(
         self,
         audit_repo: AuditLogRepository,
-        test_user: User,
-        test_admin_user: User
+        audit_dataset,
+        filter_by_company: bool,
+        expected: int
     ):
-        """Get all logs without company filter (system admin)."""
-        # Arrange - Create logs for different companies
-        log1 = AuditLog(
-            entity_type=EntityType.USER,
-            entity_id=str(uuid4()),
-            action=AuditAction.CREATE,
-            changes='{"name": "User1"}',
-            user_id=test_user.id,
-            username=test_user.name,
-            company_id=test_user.company_id,
-        )
-        log2 = AuditLog(
-            entity_type=EntityType.PRODUCT,
-            entity_id=str(uuid4()),
-            action=AuditAction.UPDATE,
-            changes='{"price": {"old": 100, "new": 200}}',
-            user_id=test_admin_user.id,
-            username=test_admin_user.name,
-            company_id=test_admin_user.company_id,
-        )
-        await audit_repo.save(log1)
-        await audit_repo.save(log2)
+        """get_page/count_all: no filter (system admin) sees all, company filter sees only that company."""
+        company = audit_dataset.company
+        company_id = str(company.id) if filter_by_company else None
 
         # Act
-        result = await audit_repo.get_all(company_id=None, skip=0, limit=10)
+        result, total = await audit_repo.get_page(company_id=company_id, skip=0, limit=10)
+        count = await audit_repo.count_all(company_id=company_id)
 
         # Assert
-        assert len(result) >= 2
-        assert any(log.entity_type == EntityType.USER for log in result)
-        assert any(log.entity_type == EntityType.PRODUCT for log in result)
+        assert len(result) == expected
+        assert total == expected
+        assert count == expected
+        if filter_by_company:
+            assert all(log.company_id == company.id for log in result)
+        else:
+            assert {log.entity_type for log in result} == {
+                EntityType.USER, EntityType.PRODUCT, EntityType.COMPANY
+            }
 
     @pytest.mark.asyncio
-    async def test_get_all_with_company_filter(
-        self,
-        audit_repo: AuditLogRepository,
-        test_user: User,
-        test_company
-    ):
-        """Get logs filtered by company."""
-        # Arrange
-        log = AuditLog(
-            entity_type=EntityType.USER,
-            entity_id=str(uuid4()),
-            action=AuditAction.CREATE,
-            changes='{"name": "Test"}',
-            user_id=test_user.id,
-            username=test_user.name,
-            company_id=test_user.company_id,
-        )
-        await audit_repo.save(log)
-
-        # Act
-        result = await audit_repo.get_all(
-            company_id=str(test_company.id),
-            skip=0,
-            limit=10
-        )
-
-        # Assert
-        assert len(result) >= 1
-        assert all(log.company_id == test_company.id for log in result)
-
-    @pytest.mark.asyncio
-    async def test_get_by_entity(
+    async def test_get_entity_page(
         self,
         audit_repo: AuditLogRepository,
         test_user: User
@@ -143,7 +116,7 @@ class TestAuditLogRepository:
         await audit_repo.save(log3)
 
         # Act
-        result = await audit_repo.get_by_entity(
+        result, total = await audit_repo.get_entity_page(
             entity_type=EntityType.USER,
             entity_id=entity_id,
             company_id=None,  # System admin
@@ -153,6 +126,7 @@ class TestAuditLogRepository:
 
         # Assert
         assert len(result) == 2
+        assert total == 2
         assert all(log.entity_id == entity_id for log in result)
         assert result[0].action == AuditAction.UPDATE  # Most recent first
         assert result[1].action == AuditAction.CREATE
@@ -161,60 +135,62 @@ class TestAuditLogRepository:
     async def test_count_all(
         self,
         audit_repo: AuditLogRepository,
+        db_session: AsyncSession,
         test_user: User
     ):
         """Count all logs."""
-        # Arrange - Create multiple logs
-        for i in range(3):
-            log = AuditLog(
-                entity_type=EntityType.PRODUCT,
-                entity_id=str(uuid4()),
-                action=AuditAction.CREATE,
-                changes=f'{{"name": "Product{i}"}}',
-                user_id=test_user.id,
-                username=test_user.name,
-                company_id=test_user.company_id,
-            )
-            await audit_repo.save(log)
+        # Arrange - Create multiple logs (one executemany INSERT)
+        await db_session.execute(insert(AuditLog), [
+            {
+                "entity_type": EntityType.PRODUCT,
+                "entity_id": str(entity_id),
+                "action": AuditAction.CREATE,
+                "changes": f'{{"name": "Product{i}"}}',
+                "user_id": test_user.id,
+                "username": test_user.name,
+                "company_id": test_user.company_id,
+            }
+            for i, entity_id in enumerate(uuid_batch(3))
+        ])
 
         # Act
         count = await audit_repo.count_all(company_id=None)
 
         # Assert
-        assert count >= 3
+        assert count == 3
 
     @pytest.mark.asyncio
     async def test_count_by_entity(
         self,
         audit_repo: AuditLogRepository,
+        db_session: AsyncSession,
         test_user: User
     ):
         """Count logs for specific entity."""
-        # Arrange
+        # Arrange - two logs for the entity plus one for a different entity
         entity_id = str(uuid4())
-        for i in range(2):
-            log = AuditLog(
-                entity_type=EntityType.COMPANY,
-                entity_id=entity_id,
-                action=AuditAction.UPDATE,
-                changes=f'{{"iteration": {i}}}',
-                user_id=test_user.id,
-                username=test_user.name,
-                company_id=None,  # Company logs have no company_id
-            )
-            await audit_repo.save(log)
-
-        # Create log for different entity
-        other_log = AuditLog(
-            entity_type=EntityType.COMPANY,
-            entity_id=str(uuid4()),
-            action=AuditAction.CREATE,
-            changes='{"name": "Other"}',
-            user_id=test_user.id,
-            username=test_user.name,
-            company_id=None,
-        )
-        await audit_repo.save(other_log)
+        await db_session.execute(insert(AuditLog), [
+            {
+                "entity_type": EntityType.COMPANY,
+                "entity_id": entity_id,
+                "action": AuditAction.UPDATE,
+                "changes": f'{{"iteration": {i}}}',
+                "user_id": test_user.id,
+                "username": test_user.name,
+                "company_id": None,  # Company logs have no company_id
+            }
+            for i in range(2)
+        ] + [
+            {
+                "entity_type": EntityType.COMPANY,
+                "entity_id": str(uuid4()),
+                "action": AuditAction.CREATE,
+                "changes": '{"name": "Other"}',
+                "user_id": test_user.id,
+                "username": test_user.name,
+                "company_id": None,
+            }
+        ])
 
         # Act
         count = await audit_repo.count_by_entity(
@@ -230,31 +206,36 @@ class TestAuditLogRepository:
     async def test_pagination(
         self,
         audit_repo: AuditLogRepository,
+        db_session: AsyncSession,
         test_user: User
     ):
         """Pagination works correctly."""
-        # Arrange - Create 5 logs
-        for i in range(5):
-            log = AuditLog(
-                entity_type=EntityType.USER,
-                entity_id=str(uuid4()),
-                action=AuditAction.CREATE,
-                changes=f'{{"index": {i}}}',
-                user_id=test_user.id,
-                username=test_user.name,
-                company_id=test_user.company_id,
-            )
-            await audit_repo.save(log)
+        # Arrange - Create 5 logs in one INSERT; distinct timestamps keep the
+        # timestamp ordering (and so the pages) deterministic
+        now = datetime.now(timezone.utc)
+        await db_session.execute(insert(AuditLog), [
+            {
+                "entity_type": EntityType.USER,
+                "entity_id": str(entity_id),
+                "action": AuditAction.CREATE,
+                "changes": f'{{"index": {i}}}',
+                "user_id": test_user.id,
+                "username": test_user.name,
+                "company_id": test_user.company_id,
+                "timestamp": now - timedelta(seconds=i),
+            }
+            for i, entity_id in enumerate(uuid_batch(5))
+        ])
 
         # Act - Get first 2
-        page1 = await audit_repo.get_all(
+        page1, _ = await audit_repo.get_page(
             company_id=str(test_user.company_id),
             skip=0,
             limit=2
         )
 
         # Act - Get next 2
-        page2 = await audit_repo.get_all(
+        page2, _ = await audit_repo.get_page(
             company_id=str(test_user.company_id),
             skip=2,
             limit=2
@@ -267,3 +248,79 @@ class TestAuditLogRepository:
         page1_ids = {log.id for log in page1}
         page2_ids = {log.id for log in page2}
         assert len(page1_ids & page2_ids) == 0  # No overlap
+
+    @pytest.mark.asyncio
+    async def test_get_page_returns_total(
+        self,
+        audit_repo: AuditLogRepository,
+        db_session: AsyncSession,
+        test_user: User
+    ):
+        """get_page returns the page and the filtered total from one query."""
+        # Arrange - Create 5 logs
+        now = datetime.now(timezone.utc)
+        await db_session.execute(insert(AuditLog), [
+            {
+                "entity_type": EntityType.USER,
+                "entity_id": str(entity_id),
+                "action": AuditAction.CREATE,
+                "changes": f'{{"index": {i}}}',
+                "user_id": test_user.id,
+                "username": test_user.name,
+                "company_id": test_user.company_id,
+                "timestamp": now - timedelta(seconds=i),
+            }
+            for i, entity_id in enumerate(uuid_batch(5))
+        ])
+        company_id = str(test_user.company_id)
+
+        # Act
+        page, total = await audit_repo.get_page(company_id=company_id, skip=2, limit=2)
+        past_end, past_end_total = await audit_repo.get_page(company_id=company_id, skip=10, limit=2)
+
+        # Assert
+        assert len(page) == 2
+        assert total == 5
+        assert past_end == []
+        assert past_end_total == 5  # Still the real total past the last page
+
+    @pytest.mark.asyncio
+    async def test_get_entity_page_cached_until_commit(
+        self,
+        audit_repo: AuditLogRepository,
+        db_session: AsyncSession,
+        test_user: User
+    ):
+        """Entity pages are served from cache until a new log for that entity is committed."""
+        # Arrange
+        entity_id = str(uuid4())
+        values = {
+            "entity_type": EntityType.PRODUCT,
+            "entity_id": entity_id,
+            "changes": "{}",
+            "user_id": test_user.id,
+            "username": test_user.name,
+            "company_id": test_user.company_id,
+        }
+        await audit_repo.save(AuditLog(action=AuditAction.CREATE, **values))
+        await db_session.commit()
+        _, first_total = await audit_repo.get_entity_page(EntityType.PRODUCT, entity_id)
+
+        # Act - a write that bypasses the repository is not seen (cached page)...
+        await db_session.execute(insert(AuditLog), [{"action": AuditAction.UPDATE, **values}])
+        _, cached_total = await audit_repo.get_entity_page(EntityType.PRODUCT, entity_id)
+
+        # ...the saving session reads its own uncommitted log past the cache...
+        await audit_repo.save(AuditLog(action=AuditAction.DELETE, **values))
+        _, own_total = await audit_repo.get_entity_page(EntityType.PRODUCT, entity_id)
+
+        # ...and the commit drops the entity's cached pages
+        await db_session.commit()
+        rows, fresh_total = await audit_repo.get_entity_page(EntityType.PRODUCT, entity_id)
+
+        # Assert
+        assert first_total == 1
+        assert cached_total == 1
+        assert own_total == 3
+        assert fresh_total == 3
+        assert len(rows) == 3
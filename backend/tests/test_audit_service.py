@@ -1,48 +1,100 @@
 """Tests for audit service."""
+import json
 import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock, AsyncMock
-from uuid import uuid4
+from itertools import count
+from uuid import UUID, uuid4
 from features.audit.service import AuditService
-from features.audit.models import AuditLog
 from features.audit.repository import AuditLogRepository
-from features.users.models import User
 from core.enums import AuditAction, EntityType, UserRole
 
 
-@pytest.fixture
+# Deterministic, never-repeating ids for mock-only fixtures (nothing here hits
+# the database, so they only need to be distinct - no os.urandom per call)
+_fixture_ids = (UUID(int=i) for i in count(1))
+
+
+class AsyncRecorder:
+    """
+    Minimal awaitable stand-in for AsyncMock on the hot save() path.
+
+    Records calls and returns return_value; supports the called / call_args
+    checks these tests make, without AsyncMock's per-call coroutine machinery.
+    """
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[tuple, dict]] = []
+        self.return_value = None
+
+    async def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.return_value
+
+    @property
+    def called(self) -> bool:
+        return bool(self.calls)
+
+    @property
+    def call_args(self) -> tuple[tuple, dict] | None:
+        return self.calls[-1] if self.calls else None
+
+    def reset_mock(self) -> None:
+        self.calls.clear()
+        self.return_value = None
+
+
+@pytest.fixture(scope="module")
 def mock_audit_repo():
-    """Mock audit repository."""
+    """Mock audit repository (built once per module, reset after every test)."""
     repo = Mock(spec=AuditLogRepository)
-    repo.save = AsyncMock()
-    repo.get_all = AsyncMock()
-    repo.get_by_entity = AsyncMock()
-    repo.count_all = AsyncMock()
-    repo.count_by_entity = AsyncMock()
+    repo.save = AsyncRecorder()
+    repo.get_page = AsyncMock()
+    repo.get_entity_page = AsyncMock()
     return repo
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def reset_mock_audit_repo(mock_audit_repo):
+    """Clear the shared repository mock's calls and return values between tests."""
+    yield
+    mock_audit_repo.reset_mock(return_value=True, side_effect=True)
+    mock_audit_repo.save.reset_mock()  # Plain recorder, not a child mock
+
+
+@pytest.fixture(scope="module")
 def audit_service(mock_audit_repo):
-    """Create audit service with mocked repository."""
+    """Create audit service with mocked repository (stateless - shared per module)."""
     return AuditService(mock_audit_repo)
 
 
+@pytest.fixture(scope="module")
+def audit_log_pool() -> tuple[object, ...]:
+    """
+    Opaque AuditLog stand-ins, shared per module.
+
+    Tests only pass these through the mocked repository and compare identity,
+    so plain sentinels do - no attributes or spec needed.
+    """
+    return tuple(object() for _ in range(4))
+
+
 @pytest.fixture
 def mock_user():
-    """Create a mock user."""
-    user = Mock(spec=User)
-    user.id = uuid4()
-    user.name = "John Doe"
-    user.company_id = uuid4()
-    user.role = UserRole.SYSTEM_ADMIN
-    return user
+    """Create a stand-in user (plain attribute bag - the service only reads attributes)."""
+    return SimpleNamespace(
+        id=next(_fixture_ids),
+        name="John Doe",
+        company_id=next(_fixture_ids),
+        role=UserRole.SYSTEM_ADMIN,
+    )
 
 
 class TestAuditService:
     """Test AuditService."""
 
     @pytest.mark.asyncio
-    async def test_log_create_success(self, audit_service, mock_audit_repo, mock_user):
+    async def test_log_create_success(self, audit_service, mock_audit_repo, mock_user, audit_log_pool):
         """Log create succeeds and filters sensitive data."""
         # Arrange
         values = {
@@ -51,7 +103,7 @@ class TestAuditService:
             "password": "secret123",  # Should be filtered
             "hashed_password": "hash",  # Should be filtered
         }
-        mock_log = Mock(spec=AuditLog)
+        mock_log = audit_log_pool[0]
         mock_audit_repo.save.return_value = mock_log
 
         # Act
@@ -73,7 +125,6 @@ class TestAuditService:
         assert saved_log.username == mock_user.name
 
         # Check sensitive data filtered
-        import json
         changes = json.loads(saved_log.changes)
         assert "password" not in changes
         assert "hashed_password" not in changes
@@ -81,12 +132,12 @@ class TestAuditService:
         assert changes["price"] == 100
 
     @pytest.mark.asyncio
-    async def test_log_update_success(self, audit_service, mock_audit_repo, mock_user):
+    async def test_log_update_success(self, audit_service, mock_audit_repo, mock_user, audit_log_pool):
         """Log update captures old and new values."""
         # Arrange
         old_values = {"name": "Old Name", "price": 100}
         new_values = {"name": "New Name", "price": 200}
-        mock_log = Mock(spec=AuditLog)
+        mock_log = audit_log_pool[0]
         mock_audit_repo.save.return_value = mock_log
 
         # Act
@@ -107,7 +158,6 @@ class TestAuditService:
         assert saved_log.username == mock_user.name
 
         # Check changes format
-        import json
         changes = json.loads(saved_log.changes)
         assert changes["name"]["old"] == "Old Name"
         assert changes["name"]["new"] == "New Name"
@@ -135,11 +185,11 @@ class TestAuditService:
         assert not mock_audit_repo.save.called
 
     @pytest.mark.asyncio
-    async def test_log_delete_success(self, audit_service, mock_audit_repo, mock_user):
+    async def test_log_delete_success(self, audit_service, mock_audit_repo, mock_user, audit_log_pool):
         """Log delete succeeds."""
         # Arrange
         values = {"name": "Deleted Item", "status": "active"}
-        mock_log = Mock(spec=AuditLog)
+        mock_log = audit_log_pool[0]
         mock_audit_repo.save.return_value = mock_log
 
         # Act
@@ -159,54 +209,54 @@ class TestAuditService:
         assert saved_log.username == mock_user.name
 
     @pytest.mark.asyncio
-    async def test_get_all_logs_system_admin(self, audit_service, mock_audit_repo, mock_user):
+    async def test_get_logs_page_system_admin(self, audit_service, mock_audit_repo, mock_user, audit_log_pool):
         """System admin sees all logs."""
         # Arrange
         mock_user.role = UserRole.SYSTEM_ADMIN
-        mock_logs = [Mock(spec=AuditLog), Mock(spec=AuditLog)]
-        mock_audit_repo.get_all.return_value = mock_logs
+        mock_logs = list(audit_log_pool[:2])
+        mock_audit_repo.get_page.return_value = (mock_logs, 2)
 
         # Act
-        result = await audit_service.get_all_logs(mock_user, skip=0, limit=10)
+        result = await audit_service.get_logs_page(mock_user, skip=0, limit=10)
 
         # Assert
-        assert result == mock_logs
-        mock_audit_repo.get_all.assert_called_once_with(
+        assert result == (mock_logs, 2)
+        mock_audit_repo.get_page.assert_called_once_with(
             company_id=None,  # System admin sees all
             skip=0,
             limit=10
         )
 
     @pytest.mark.asyncio
-    async def test_get_all_logs_company_admin(self, audit_service, mock_audit_repo, mock_user):
-        """Company admin sees only their company's logs."""
+    async def test_get_logs_page_company_admin(self, audit_service, mock_audit_repo, mock_user, audit_log_pool):
+        """Company admin's page and total are scoped to their company."""
         # Arrange
         mock_user.role = UserRole.COMPANY_ADMIN
-        mock_logs = [Mock(spec=AuditLog)]
-        mock_audit_repo.get_all.return_value = mock_logs
+        mock_logs = list(audit_log_pool[:1])
+        mock_audit_repo.get_page.return_value = (mock_logs, 1)
 
         # Act
-        result = await audit_service.get_all_logs(mock_user, skip=5, limit=20)
+        result = await audit_service.get_logs_page(mock_user, skip=0, limit=20)
 
         # Assert
-        assert result == mock_logs
-        mock_audit_repo.get_all.assert_called_once_with(
+        assert result == (mock_logs, 1)
+        mock_audit_repo.get_page.assert_called_once_with(
             company_id=str(mock_user.company_id),
-            skip=5,
+            skip=0,
             limit=20
         )
 
     @pytest.mark.asyncio
-    async def test_get_entity_logs_system_admin(self, audit_service, mock_audit_repo, mock_user):
+    async def test_get_entity_logs_page_system_admin(self, audit_service, mock_audit_repo, mock_user, audit_log_pool):
         """System admin sees all entity logs."""
         # Arrange
         mock_user.role = UserRole.SYSTEM_ADMIN
         entity_id = str(uuid4())
-        mock_logs = [Mock(spec=AuditLog)]
-        mock_audit_repo.get_by_entity.return_value = mock_logs
+        mock_logs = list(audit_log_pool[:1])
+        mock_audit_repo.get_entity_page.return_value = (mock_logs, 1)
 
         # Act
-        result = await audit_service.get_entity_logs(
+        result = await audit_service.get_entity_logs_page(
             mock_user,
             EntityType.USER,
             entity_id,
@@ -215,8 +265,8 @@ class TestAuditService:
         )
 
         # Assert
-        assert result == mock_logs
-        mock_audit_repo.get_by_entity.assert_called_once_with(
+        assert result == (mock_logs, 1)
+        mock_audit_repo.get_entity_page.assert_called_once_with(
             entity_type=EntityType.USER,
             entity_id=entity_id,
             company_id=None,  # System admin sees all
@@ -225,7 +275,7 @@ class TestAuditService:
         )
 
     @pytest.mark.asyncio
-    async def test_sensitive_data_filtering(self, audit_service, mock_audit_repo, mock_user):
+    async def test_sensitive_data_filtering(self, audit_service, mock_audit_repo, mock_user, audit_log_pool):
         """Sensitive fields are filtered from audit logs."""
         # Arrange
         values = {
@@ -238,7 +288,7 @@ class TestAuditService:
             "secret": "secret_value",
             "normal_field": "visible",
         }
-        mock_log = Mock(spec=AuditLog)
+        mock_log = audit_log_pool[0]
         mock_audit_repo.save.return_value = mock_log
 
         # Act
@@ -252,7 +302,6 @@ class TestAuditService:
 
         # Assert
         saved_log = mock_audit_repo.save.call_args[0][0]
-        import json
         changes = json.loads(saved_log.changes)
 
         # Sensitive fields should be filtered
@@ -266,3 +315,33 @@ class TestAuditService:
         # Normal fields should remain
         assert changes["username"] == "john"
         assert changes["normal_field"] == "visible"
+
+    def test_filter_sensitive_data_any_case(self, audit_service):
+        """Every SENSITIVE_FIELDS entry is dropped regardless of key case."""
+        # Arrange
+        values = {"normal_field": "visible"}
+        for field in AuditService.SENSITIVE_FIELDS:
+            values[field] = "x"
+            values[field.upper()] = "x"
+
+        # Act
+        filtered = audit_service._filter_sensitive_data(values)
+
+        # Assert
+        assert filtered == {"normal_field": "visible"}
+
+    @pytest.mark.parametrize(
+        "old_values, new_values, expected",
+        [
+            ({"name": "A", "price": 1}, {"name": "B", "price": 1}, {"name": {"old": "A", "new": "B"}}),
+            ({"name": "A"}, {"name": "A"}, {}),
+            ({"password": "old"}, {"password": "new"}, {}),  # Sensitive changes never logged
+            ({}, {"name": "B"}, {}),  # Field without an old value is not a change
+        ],
+        ids=["changed", "unchanged", "sensitive", "new_field"],
+    )
+    def test_format_changes_for_update(self, audit_service, old_values, new_values, expected):
+        """UPDATE changes hold only non-sensitive fields whose value changed."""
+        changes = json.loads(audit_service._format_changes_for_update(old_values, new_values))
+
+        assert changes == expected
@@ -15,7 +15,7 @@ from core.exceptions import (
     UserNotFoundException,
     PasswordTooWeakException,
 )
-from core.security import verify_password, verify_refresh_token, hash_password
+from core.security import verify_password, verify_refresh_token
 
 
 # ============================================================================
@@ -9,7 +9,6 @@ from features.users.repository import UserRepository
 from features.auth.repository import RefreshTokenRepository
 from features.company.models import Company
 from features.company.repository import CompanyRepository
-from core.security import hash_password
 
 
 # ============================================================================
@@ -24,13 +23,14 @@ class TestUserRepository:
         self,
         user_repo: UserRepository,
         test_company: Company,
+        test_password_hash: str,
     ):
         """Create user stores user in database."""
         # Act
         user = await user_repo.create(
             name="Test User",
             phone_number="9647700000010",
-            hashed_password=hash_password("TestPass123"),
+            hashed_password=test_password_hash,
             company_id=str(test_company.id),
             role="viewer",
         )
@@ -47,13 +47,14 @@ class TestUserRepository:
     async def test_create_system_admin(
         self,
         user_repo: UserRepository,
+        test_password_hash: str,
     ):
         """Create system admin with no company."""
         # Act
         user = await user_repo.create(
             name="System Admin",
             phone_number="9647700000020",
-            hashed_password=hash_password("AdminPass123"),
+            hashed_password=test_password_hash,
             company_id=None,
             role="system_admin",
         )
@@ -222,13 +223,14 @@ class TestUserRepository:
         user_repo: UserRepository,
         test_company: Company,
         db_session: AsyncSession,
+        test_password_hash: str,
     ):
         """Delete user removes user from database."""
         # Arrange - create user to delete
         user = await user_repo.create(
             name="Test User",
             phone_number="9647700000099",
-            hashed_password=hash_password("Test123"),
+            hashed_password=test_password_hash,
             company_id=str(test_company.id),
             role="viewer",
         )
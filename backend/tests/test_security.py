@@ -2,7 +2,9 @@
 import pytest
 import time
 from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 
+from core import security
 from core.security import (
     normalize_phone_number,
     hash_password,
@@ -192,6 +194,87 @@ class TestAccessTokens:
         with pytest.raises(InvalidTokenException, match="Not an access token"):
             verify_access_token(refresh_token)
 
+    def test_verify_access_token_repeated_call_is_isolated(self):
+        """Repeated verification (cache hit) returns an equal, independent payload."""
+        token = create_access_token(
+            user_id="user-123",
+            phone_number="9647700000000",
+            is_active=True,
+            company_id="company-456",
+            role="user",
+        )
+
+        first = verify_access_token(token)
+        first["user_id"] = "tampered"
+        second = verify_access_token(token)
+
+        assert second["user_id"] == "user-123"
+        assert second["type"] == "access"
+
+    @pytest.fixture
+    def token_cache(self, monkeypatch):
+        """Empty, private access-token cache with a controllable clock."""
+        cache = {}
+        clock = SimpleNamespace(time=time.time, monotonic=time.monotonic)
+        monkeypatch.setattr(security, "_access_token_cache", cache)
+        monkeypatch.setattr(security, "time", clock)
+        return SimpleNamespace(entries=cache, clock=clock)
+
+    @staticmethod
+    def _token(user_id: str = "user-123") -> str:
+        return create_access_token(
+            user_id=user_id,
+            phone_number="9647700000000",
+            is_active=True,
+            company_id="company-456",
+            role="user",
+        )
+
+    def test_verify_access_token_cache_hit_rechecks_exp(self, token_cache):
+        """A cached token past its exp is rejected, not served from cache."""
+        token = self._token()
+        payload = verify_access_token(token)
+        assert token in token_cache.entries
+
+        token_cache.clock.time = lambda: payload["exp"] + 1
+
+        with pytest.raises(TokenExpiredException):
+            verify_access_token(token)
+        assert token not in token_cache.entries
+
+    def test_verify_access_token_cache_entry_expires(self, token_cache, monkeypatch):
+        """Entries older than the TTL are decoded again."""
+        decodes = []
+        real_decode = security.jwt.decode
+
+        def counting_decode(*args, **kwargs):
+            decodes.append(args[0])
+            return real_decode(*args, **kwargs)
+
+        monkeypatch.setattr(security.jwt, "decode", counting_decode)
+        token = self._token()
+        token_cache.clock.monotonic = lambda: 1000.0
+        verify_access_token(token)
+
+        token_cache.clock.monotonic = lambda: 1000.0 + security._ACCESS_TOKEN_CACHE_TTL_SECONDS - 1
+        verify_access_token(token)
+        assert len(decodes) == 1
+
+        token_cache.clock.monotonic = lambda: 1000.0 + security._ACCESS_TOKEN_CACHE_TTL_SECONDS
+        verify_access_token(token)
+        assert len(decodes) == 2
+
+    def test_verify_access_token_cache_is_bounded(self, token_cache, monkeypatch):
+        """The cache never grows past its size; the oldest entries go first."""
+        monkeypatch.setattr(security, "_ACCESS_TOKEN_CACHE_SIZE", 3)
+        tokens = [self._token(f"user-{i}") for i in range(5)]
+
+        for token in tokens:
+            verify_access_token(token)
+            assert len(token_cache.entries) <= 3
+
+        assert list(token_cache.entries) == tokens[2:]
+
     def test_access_token_system_admin_no_company(self):
         """Access token for system admin has no company_id."""
         token = create_access_token(
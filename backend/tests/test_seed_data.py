@@ -0,0 +1,59 @@
+"""Tests for seed data row building - the asyncpg COPY path."""
+import pytest
+from collections import Counter
+from datetime import datetime, timezone
+from decimal import Decimal
+from uuid import uuid4
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+
+from scripts.db.seed_data import build_product_rows, build_user_rows, copy_records
+from features.product.models import Product
+from features.users.models import User
+
+
+@pytest.fixture(scope="module")
+def company_ids():
+    """Company name -> id, as seed_companies returns it."""
+    return {"Acme": uuid4()}
+
+
+def assert_not_null_columns_filled(table, columns: list[str], records: list[tuple]) -> None:
+    """Every NOT NULL column without a server default is sent, and never as NULL."""
+    required = [c.name for c in table.columns if not c.nullable and c.server_default is None]
+    assert set(required) <= set(columns)
+    for record in records:
+        values = dict(zip(columns, record))
+        assert all(values[name] is not None for name in required)
+
+
+class TestCopyRecords:
+    """COPY skips SQLAlchemy defaults - copy_records must fill them in."""
+
+    def test_user_rows_fill_defaults(self, company_ids):
+        """Columns build_user_rows leaves out (is_phone_verified) get their defaults."""
+        users_data = [
+            {"name": f"User {i}", "phone_number": f"0770{i:07d}", "company_name": "Acme", "role": "viewer"}
+            for i in range(3)
+        ]
+        rows = build_user_rows(users_data, company_ids, ["hash"] * len(users_data))
+
+        columns, records = copy_records(User.__table__, rows, asyncpg_dialect())
+
+        assert_not_null_columns_filled(User.__table__, columns, records)
+        values = dict(zip(columns, records[0]))
+        assert values["is_phone_verified"] is False
+        assert values["last_login_at"] is None
+
+    def test_product_rows_fill_defaults(self, company_ids):
+        """Product rows carry every NOT NULL column."""
+        products_data = [
+            {"name": f"Product {i}", "sku": f"SKU-{i}", "selling_price": "9.99", "company_name": "Acme"}
+            for i in range(3)
+        ]
+        rows = build_product_rows(products_data, company_ids, Counter(), datetime.now(timezone.utc))
+
+        columns, records = copy_records(Product.__table__, rows, asyncpg_dialect())
+
+        assert_not_null_columns_filled(Product.__table__, columns, records)
+        values = dict(zip(columns, records[0]))
+        assert values["cost_price"] == Decimal("0.00")